@@ -21,7 +21,6 @@ from jirassicpack.utils.logging import contextual_log, redact_sensitive
 from jirassicpack.utils.jira import select_jira_user, select_account_id, select_property_key, search_issues, clear_all_caches, refresh_user_cache
 from colorama import Fore, Style
 from pythonjsonlogger import jsonlogger
-import json
 from dotenv import load_dotenv
 import uuid
 import socket
@@ -35,7 +34,7 @@ import shutil
 import requests
 import threading
 from jirassicpack.utils.rich_prompt import (
-    rich_panel, rich_info, rich_error, rich_success,
+    rich_info, rich_error, rich_success,
     panel_objects_in_mirror, panel_clever_girl,
     panel_hold_onto_your_butts, panel_big_pile_of_errors, panel_nobody_cares,
     panel_combined_welcome
@@ -458,14 +457,6 @@ def output_all_user_property_keys(jira: JiraClient, options: dict, unique_suffix
             error(FAILED_TO.format(action='fetch user property keys', error=e), extra=context)
             contextual_log('error', f"🦖 [CLI] [output_all_user_property_keys] Exception: {e}", exc_info=True, extra=context)
 
-def pretty_print_result(result):
-    """
-    Pretty-prints a result object as formatted JSON in a rich panel.
-    Args:
-        result (Any): The object to print.
-    """
-    rich_panel(json.dumps(result, indent=2), style="info")
-
 def halt_cli(reason=None):
     """
     Halts the CLI application, printing a message and logging the reason.
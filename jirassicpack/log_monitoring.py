@@ -11,13 +11,26 @@ All analytics are modular, robust, and exportable as Markdown or JSON.
 # =========================
 import json
 import argparse
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, Callable, NamedTuple
 from datetime import datetime
 import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from collections import Counter, defaultdict
-from tabulate import tabulate
-from statistics import mean, stdev
-from jirassicpack.utils.validation_utils import safe_get
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import compress, repeat
+from math import fsum, sqrt
+from operator import eq, le, mul
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
 from jirassicpack.utils.prompt_utils import prompt_text, prompt_select
 from jirassicpack.utils.logging import contextual_log
 from jirassicpack.analytics.helpers import build_report_sections
@@ -25,170 +38,717 @@ from jirassicpack.analytics.helpers import build_report_sections
 LOG_FILE = 'jirassicpack.log'
 INTERVAL_CHOICES = ["hour", "day"]
 LOG_LEVEL_CHOICES = ["INFO", "ERROR", "WARNING", "DEBUG"]
+ASCTIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Length of the asctime prefix ('YYYY-MM-DD HH:MM:SS') that identifies a bucket, and the suffix completing its label
+BUCKET_PREFIXES = {'hour': (13, ':00'), 'day': (10, '')}
+# Both accept bytes, so raw lines never need decoding to str first
+_json_loads = orjson.loads if orjson else json.loads
+READ_CHUNK_SIZE = 1 << 20  # 1 MiB
+# Values analytics use for fields an entry lacks. They are applied to the entry's LogRec
+# record only; the entry dicts keep just what was logged, so exports never invent fields.
+FIELD_DEFAULTS = {'levelname': 'N/A', 'feature': 'N/A', 'user': 'N/A', 'correlation_id': None, 'message': 'N/A', 'asctime': None}
+# Low-cardinality string fields interned at parse time, so repeats share one object
+INTERNED_FIELDS = ('feature', 'user', 'correlation_id')
+# Files at least this large are decoded by worker processes; below it process startup costs more than it saves
+PARALLEL_PARSE_MIN_BYTES = 64 << 20  # 64 MiB
 
 # =========================
 # Core Log Parsing Utilities
 # =========================
+def _iter_lines(log_file: str, chunk_size: int = READ_CHUNK_SIZE):
+    """
+    Yield the non-empty lines of a file as bytes, reading it in large binary chunks and
+    splitting on newlines in-buffer (no per-line text decoding as with `for line in file`).
+    A partial last line in each chunk is carried over to the next one.
+    """
+    tail = b''
+    with open(log_file, 'rb', buffering=chunk_size) as file:
+        _advise_sequential(file.fileno())
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            *lines, tail = (tail + chunk).split(b'\n')
+            yield from filter(None, lines)
+    if tail:
+        yield tail
+
+
+def _advise_sequential(fd: int, offset: int = 0, length: int = 0) -> None:
+    """
+    Hint the kernel (where supported) that [offset, offset+length) will be read front to back,
+    so it reads ahead aggressively while we parse the previous chunk. No-op elsewhere.
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, offset, length, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
 def parse_logs(log_file: str = LOG_FILE) -> List[Dict[str, Any]]:
     """
     Parse the log file and return a list of log entries (as dicts).
     Supports JSON log format (default for Jirassic Pack). Skips malformed lines.
+    Each entry's 'asctime' is parsed once here and stored as a datetime under '_dt', and
+    'levelname' is upper-cased. Fields missing from a line stay missing (see FIELD_DEFAULTS).
 
     Args:
         log_file: Path to the log file.
     Returns:
         List of log entry dictionaries.
     """
-    logs: List[Dict[str, Any]] = []
     if not os.path.exists(log_file):
         print(f"Log file not found: {log_file}")
-        return logs
-    with open(log_file, 'r') as file:
-        for line in file:
+        return []
+    if os.path.getsize(log_file) >= PARALLEL_PARSE_MIN_BYTES and (os.cpu_count() or 1) > 1:
+        try:
+            return parse_logs_parallel(log_file)
+        except (OSError, BrokenProcessPool) as error:
+            contextual_log('warning', f"Parallel log parsing failed, falling back to a single process: {error}", extra={"feature": "log_parser"})
+    return list(iter_logs(log_file))
+
+
+def parse_logs_parallel(log_file: str = LOG_FILE, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Parse a large log file in worker processes. The file is split into byte ranges that
+    start and end on line boundaries; each worker decodes one range and the results are
+    concatenated in file order.
+
+    Args:
+        log_file: Path to the log file.
+        workers: Number of worker processes (default: min(4, cpu count)).
+    Returns:
+        List of log entry dictionaries, identical to parse_logs() output.
+    """
+    workers = workers or min(4, (os.cpu_count() or 2))
+    ranges = _line_aligned_ranges(log_file, workers)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        entries: List[Dict[str, Any]] = []
+        # Extending by whole (sized) chunks grows the list once per chunk rather than per entry
+        for chunk in pool.map(_parse_byte_range, [log_file] * len(ranges), *zip(*ranges)):
+            entries += chunk
+        return entries
+
+
+def _line_aligned_ranges(log_file: str, parts: int) -> List[Tuple[int, int]]:
+    """Split the file into up to `parts` (start, end) byte ranges, each ending just after a newline."""
+    size = os.path.getsize(log_file)
+    bounds = [0]
+    with open(log_file, 'rb') as file:
+        for part in range(1, parts):
+            file.seek(max(bounds[-1], size * part // parts))
+            file.readline()  # move to the start of the next line
+            bounds.append(file.tell())
+    bounds.append(size)
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if end > start]
+
+
+def _parse_byte_range(log_file: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Worker for parse_logs_parallel: decode the lines in [start, end) of the file."""
+    with open(log_file, 'rb') as file:
+        _advise_sequential(file.fileno(), start, end - start)
+        file.seek(start)
+        data = file.read(end - start)
+    return list(_entries_from_lines(filter(None, data.split(b'\n'))))
+
+
+def iter_logs(log_file: str = LOG_FILE, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily yield log entries (as dicts) from the log file, skipping malformed lines.
+    Lets callers filter or aggregate without materializing the whole file as a list.
+
+    Args:
+        log_file: Path to the log file.
+        predicate: Optional callable; only entries for which it returns True are yielded.
+    Returns:
+        Iterator of log entry dictionaries, each with its parsed timestamp under '_dt'
+        and an upper-cased 'levelname'.
+    """
+    return _entries_from_lines(_iter_lines(log_file), predicate)
+
+
+def iter_error_logs(log_file: str = LOG_FILE) -> Iterator[Dict[str, Any]]:
+    """
+    Like iter_logs(), but yields only ERROR entries. Lines that do not contain 'error'
+    in any case are dropped before JSON decoding, so the other levels (usually the bulk
+    of the file) cost a substring scan each rather than a full parse.
+    """
+    lines = _lines_containing(_iter_lines(log_file), b'ERROR', any_case=True)
+    return _entries_from_lines(lines, lambda entry: entry.get('levelname') == 'ERROR')
+
+
+def _lines_containing(lines: Iterable[bytes], marker: bytes, any_case: bool = False) -> Iterator[bytes]:
+    """
+    The lines that contain marker. With any_case, marker must be upper case and matches in
+    any case, since level names are only normalized after decoding; lines that already
+    contain it verbatim skip the upper-cased copy.
+    """
+    if any_case:
+        return (line for line in lines if marker in line or marker in line.upper())
+    return (line for line in lines if marker in line)
+
+
+def parse_logs_filtered(log_file: str = LOG_FILE, level: Optional[str] = None, correlation_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Equivalent to filter_logs(iter_logs(log_file), level=level, correlation_id=correlation_id),
+    but lines in which the level name (in any case) or the correlation ID does not occur at
+    all are dropped before JSON decoding. For selective filters most of the file is never
+    parsed. The field checks in filter_logs stay authoritative.
+    """
+    lines = _iter_lines(log_file)
+    if level:
+        lines = _lines_containing(lines, level.upper().encode(), any_case=True)
+    # An ID needing JSON escapes may not appear verbatim in the line, so only plain ones prefilter
+    if correlation_id and correlation_id.isascii() and correlation_id.isprintable() and not any(c in correlation_id for c in '"\\'):
+        lines = _lines_containing(lines, correlation_id.encode())
+    return filter_logs(_entries_from_lines(lines), level=level, correlation_id=correlation_id)
+
+
+def _entries_from_lines(lines: Iterable[bytes], predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[Dict[str, Any]]:
+    """Decode raw log lines into normalized entries (see iter_logs), skipping malformed lines."""
+    # Per-parse intern table and timestamp memo: unlike sys.intern or a module-level cache
+    # they do not outlive the parse, so nothing is held once parsing is done
+    intern = {}.setdefault
+    ts_cache: Dict[str, Optional[datetime]] = {}
+    for line in lines:
+        try:
+            entry = _json_loads(line)
+        except ValueError:
+            # orjson rejects NaN/Infinity, which the stdlib encoder (and so our JSON logger)
+            # writes; give such lines to json.loads before skipping them as malformed
+            if _json_loads is json.loads:
+                continue
             try:
                 entry = json.loads(line)
-                logs.append(entry)
-            except Exception:
-                continue  # Skip malformed lines
-    return logs
+            except ValueError:
+                continue  # Skip malformed lines (JSONDecodeError and bad UTF-8 are both ValueErrors)
+        if not isinstance(entry, dict):
+            continue  # Valid JSON, but not a log record
+        entry['_dt'] = _parse_asctime(entry.get('asctime'), ts_cache)
+        levelname = entry.get('levelname')
+        if isinstance(levelname, str):
+            if not levelname.isupper():
+                levelname = levelname.upper()  # Our own logger already writes upper case; only others need the copy
+            entry['levelname'] = intern(levelname, levelname)
+        for key in INTERNED_FIELDS:
+            value = entry.get(key)
+            if isinstance(value, str):
+                entry[key] = intern(value, value)
+        if predicate is None or predicate(entry):
+            yield entry
+
+
+# Cap on a parse's timestamp memo. Logs are written in time order, so lookups only ever hit
+# recent seconds and dropping the memo when it fills costs little; 64K seconds is ~18 hours.
+TS_CACHE_MAX_SIZE = 1 << 16
+
+
+def _parse_asctime(asctime: Optional[str], ts_cache: Dict[str, Optional[datetime]]) -> Optional[datetime]:
+    """
+    Parse a log 'asctime' value (YYYY-MM-DD HH:MM:SS[,ms]) from its fixed-width 19-character
+    prefix, memoized in ts_cache ('YYYY-MM-DD HH:MM:SS' prefix -> datetime or None). Log
+    timestamps repeat within each second, so most lookups hit, and entries from the same
+    second share one datetime object. Cache misses take an ISO-8601 C fast path instead of
+    strptime: ciso8601 when installed, else datetime.fromisoformat. Returns None if missing
+    or malformed.
+    """
+    try:
+        return ts_cache[asctime[:19]]
+    except KeyError:
+        pass
+    except TypeError:
+        return None  # Missing or non-string asctime
+    prefix = asctime[:19]
+    try:
+        dt = _parse_iso_datetime(prefix)
+    except ValueError:
+        dt = None
+    if len(ts_cache) >= TS_CACHE_MAX_SIZE:
+        ts_cache.clear()
+    ts_cache[prefix] = dt
+    return dt
+
+
+def public_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a log entry without the fields derived at parse time (e.g. '_dt'), for display/export."""
+    return {key: value for key, value in entry.items() if key != '_dt'}
 
 
 def filter_logs(
-    logs: List[Dict[str, Any]],
+    logs: Iterable[Dict[str, Any]],
     level: Optional[str] = None,
     feature: Optional[str] = None,
     correlation_id: Optional[str] = None,
     start_time: Optional[str] = None,
-    end_time: Optional[str] = None
+    end_time: Optional[str] = None,
+    assume_sorted: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Filter logs by level, feature, correlation ID, and time frame.
+    Accepts a list (or other sequence) or a stream (e.g. iter_logs()); only matching
+    entries are kept. For a sequence, the time frame is located by binary search over a
+    cached sorted timestamp index and the other criteria are applied as masks over the
+    cached column view (see _filter_log_list). A stream is checked in a single pass; with
+    assume_sorted, for streams known to be in time order, that pass stops at the first
+    entry past end_time instead of reading to the end.
 
     Args:
-        logs: List of log entry dictionaries.
+        logs: Iterable of log entry dictionaries.
         level: Log level to filter by (e.g., 'ERROR').
         feature: Feature/module name to filter by.
         correlation_id: Correlation ID to filter by.
         start_time: Start time (YYYY-MM-DD HH:MM:SS) for filtering.
         end_time: End time (YYYY-MM-DD HH:MM:SS) for filtering.
+        assume_sorted: Stream only; stop at the first entry after end_time.
     Returns:
         Filtered list of log entries.
     """
-    def parse_time(timestamp: str):
-        try:
-            return datetime.strptime(timestamp.split(',')[0], "%Y-%m-%d %H:%M:%S")
-        except Exception:
-            return None
-    filtered_logs = logs
-    if correlation_id:
-        filtered_logs = [log for log in filtered_logs if log.get('correlation_id') == correlation_id]
-    if level:
-        filtered_logs = [log for log in filtered_logs if log.get('levelname', '').upper() == level.upper()]
-    if feature:
-        filtered_logs = [log for log in filtered_logs if log.get('feature') == feature]
-    if start_time:
-        start_dt = datetime.strptime(start_time, "%Y-%m-%d %H:%M:%S")
-        filtered_logs = [log for log in filtered_logs if parse_time(log.get('asctime', '')) and parse_time(log.get('asctime', '')) >= start_dt]
-    if end_time:
-        end_dt = datetime.strptime(end_time, "%Y-%m-%d %H:%M:%S")
-        filtered_logs = [log for log in filtered_logs if parse_time(log.get('asctime', '')) and parse_time(log.get('asctime', '')) <= end_dt]
+    level = level.upper() if level else None
+    start_dt = datetime.strptime(start_time, ASCTIME_FORMAT) if start_time else None
+    end_dt = datetime.strptime(end_time, ASCTIME_FORMAT) if end_time else None
+    if isinstance(logs, Sequence):
+        if not isinstance(logs, list):
+            logs = list(logs)
+        return _filter_log_list(logs, level, feature, correlation_id, start_dt, end_dt)
+    filtered_logs = []
+    by_time = bool(start_dt or end_dt)
+    for log in logs:
+        if by_time:
+            # Read the timestamp once and test both bounds against it
+            if (log_dt := log.get('_dt')) is None or (start_dt and log_dt < start_dt):
+                continue
+            if end_dt and log_dt > end_dt:
+                if assume_sorted:
+                    break
+                continue
+        if correlation_id and log.get('correlation_id') != correlation_id:
+            continue
+        if level and log.get('levelname', FIELD_DEFAULTS['levelname']) != level:
+            continue
+        if feature and log.get('feature', FIELD_DEFAULTS['feature']) != feature:
+            continue
+        filtered_logs.append(log)
     return filtered_logs
 
 
+def _filter_log_list(
+    logs: List[Dict[str, Any]],
+    level: Optional[str],
+    feature: Optional[str],
+    correlation_id: Optional[str],
+    start_dt: Optional[datetime],
+    end_dt: Optional[datetime]
+) -> List[Dict[str, Any]]:
+    """
+    filter_logs for a list: narrow a set of row positions with boolean masks built in C
+    (map(eq, ...) over the cached columns, then compress), instead of testing each entry
+    in a Python loop. Matches are returned in file order.
+    """
+    if start_dt or end_dt:
+        sorted_dts, positions = _time_index(logs)
+        low = bisect_left(sorted_dts, start_dt) if start_dt else 0
+        high = bisect_right(sorted_dts, end_dt) if end_dt else len(sorted_dts)
+        rows = sorted(positions[low:high])
+    else:
+        rows = None  # every row; masks then read whole columns without gathering
+    columns = logs_to_columns(logs)
+    for value, column in ((correlation_id, columns.correlation_id), (level, columns.levelname), (feature, columns.feature)):
+        if value:
+            if rows is None:
+                rows = list(compress(range(len(logs)), map(eq, column, repeat(value))))
+            else:
+                rows = list(compress(rows, map(eq, map(column.__getitem__, rows), repeat(value))))
+    if rows is None:
+        return list(logs)
+    return list(map(logs.__getitem__, rows))
+
+
+class LogRec(NamedTuple):
+    """
+    Compact record of the fields analytics read from a log entry. Parsed entries stay
+    dicts (they are displayed and exported whole); analytics work on these instead.
+    """
+    levelname: str
+    feature: Any
+    user: Any
+    correlation_id: Optional[str]
+    dt: Optional[datetime]
+    message: Any
+    asctime: Optional[str]
+
+
+# Entry key behind each LogRec field, and the value used when an entry lacks it
+_RECORD_KEYS = ('levelname', 'feature', 'user', 'correlation_id', '_dt', 'message', 'asctime')
+_RECORD_DEFAULTS = tuple(FIELD_DEFAULTS.get(key) for key in _RECORD_KEYS)
+
+
+def _record_fields(entry: Dict[str, Any]) -> Tuple[Any, ...]:
+    """The LogRec field values of a parsed entry, with FIELD_DEFAULTS for the keys it lacks."""
+    return tuple(map(entry.get, _RECORD_KEYS, _RECORD_DEFAULTS))
+
+
+def log_records(logs) -> List[LogRec]:
+    """
+    LogRec view of a list of parsed entries, cached per logs list.
+    A list that already holds LogRec records is returned as is.
+    """
+    if logs and isinstance(logs[0], LogRec):
+        return logs
+    return _cached_by_identity(_records_cache, logs, _build_records)
+
+
+def _build_records(logs: List[Dict[str, Any]]) -> List[LogRec]:
+    return list(map(LogRec._make, map(_record_fields, logs)))
+
+
+def iter_records(logs) -> Iterable[LogRec]:
+    """LogRec records for a list (cached, see log_records) or a stream of parsed entries or records."""
+    if isinstance(logs, list):
+        return log_records(logs)
+    return (log if isinstance(log, LogRec) else LogRec._make(_record_fields(log)) for log in logs)
+
+
+def iter_log_records(log_file: str = LOG_FILE, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Iterator[LogRec]:
+    """Like iter_logs(), but yields compact LogRec records for analytics-only consumers."""
+    return map(LogRec._make, map(_record_fields, iter_logs(log_file, predicate)))
+
+
+class LogColumns(NamedTuple):
+    """
+    Column-oriented view of a logs list: one sequence per LogRec field, aligned by row,
+    plus an is_error mask. Analytics count whole columns (or the ERROR-only columns from
+    _errors_view) with Counter, so the per-row work runs in C rather than in a Python loop.
+    """
+    levelname: Tuple[str, ...]
+    feature: Tuple[Any, ...]
+    user: Tuple[Any, ...]
+    correlation_id: Tuple[Any, ...]
+    dt: Tuple[Optional[datetime], ...]
+    message: Tuple[Any, ...]
+    asctime: Tuple[Optional[str], ...]
+    is_error: List[bool]
+
+
+def logs_to_columns(logs) -> LogColumns:
+    """
+    Build the LogColumns view of the logs. Cached per logs list, so the column extraction
+    is paid once no matter how many analytics run against it.
+    """
+    if not isinstance(logs, list):
+        return _build_columns(list(iter_records(logs)))
+    return _cached_by_identity(_columns_cache, logs, lambda entries: _build_columns(log_records(entries)))
+
+
+def _build_columns(records: List[LogRec]) -> LogColumns:
+    # zip(*records) transposes rows into columns in C
+    columns = list(zip(*records)) or [()] * len(LogRec._fields)
+    return LogColumns(*columns, is_error=[lvl == 'ERROR' for lvl in columns[0]])
+
+
+def _cached_by_identity(cache: Dict[int, Tuple[Any, int, Any]], logs, build: Callable[[Any], Any]) -> Any:
+    """
+    Single-slot cache keyed on the identity of a logs list. The list itself is held in the
+    slot so its id cannot be reused by another object while the entry is alive, so every
+    cache listed in _LOG_VIEW_CACHES must be emptied with clear_log_caches() once the list
+    is no longer in use. A change in the list's length (entries appended or removed)
+    rebuilds the value; replacing entries in place is not detected, so pass a new list instead.
+    """
+    cached = cache.get(id(logs))
+    if cached is None or cached[0] is not logs or cached[1] != len(logs):
+        cache.clear()
+        cached = cache[id(logs)] = (logs, len(logs), build(logs))
+    return cached[2]
+
+
+def clear_log_caches() -> None:
+    """Drop every cached view of a logs list, releasing the list and everything derived from it."""
+    for cache in _LOG_VIEW_CACHES:
+        cache.clear()
+
+
+def _errors_view(logs) -> LogColumns:
+    """
+    Column view of just the ERROR-level rows, cached per logs list. The error analytics
+    count over these short columns instead of re-masking every row of the full logs.
+    A log file path is read with iter_error_logs, so only ERROR lines are decoded.
+    """
+    if isinstance(logs, str):
+        return _build_columns(list(iter_records(iter_error_logs(logs))))
+    if not isinstance(logs, list):
+        return _build_columns([record for record in iter_records(logs) if record.levelname == 'ERROR'])
+    return _cached_by_identity(_errors_cache, logs, _build_errors_view)
+
+
+def _build_errors_view(logs: List[Dict[str, Any]]) -> LogColumns:
+    return _build_columns(list(compress(log_records(logs), logs_to_columns(logs).is_error)))
+
+
+_records_cache: Dict[int, Tuple[Any, int, List[LogRec]]] = {}
+_columns_cache: Dict[int, Tuple[Any, int, LogColumns]] = {}
+_errors_cache: Dict[int, Tuple[Any, int, LogColumns]] = {}
+
+
+def _time_index(logs: List[Dict[str, Any]]) -> Tuple[List[datetime], List[int]]:
+    """
+    Timestamps of the entries that have one, in ascending order, alongside their row
+    positions in logs. Cached per logs list; for logs already in time order the sort is linear.
+    """
+    return _cached_by_identity(_time_index_cache, logs, _build_time_index)
+
+
+def _build_time_index(logs: List[Dict[str, Any]]) -> Tuple[List[datetime], List[int]]:
+    dts = logs_to_columns(logs).dt
+    positions = sorted((position for position, dt in enumerate(dts) if dt), key=dts.__getitem__)
+    return [dts[position] for position in positions], positions
+
+
+_time_index_cache: Dict[int, Tuple[Any, int, Tuple[List[datetime], List[int]]]] = {}
+
+
 def error_rate_over_time(logs, interval='hour'):
-    time_format = "%Y-%m-%d %H:%M:%S"
-    buckets = defaultdict(int)
-    for log in logs:
-        if log.get('levelname', '').upper() == 'ERROR':
-            asctime = log.get('asctime', '')
-            try:
-                dt = datetime.strptime(asctime.split(',')[0], time_format)
-                if interval == 'hour':
-                    bucket = dt.strftime('%Y-%m-%d %H:00')
-                elif interval == 'day':
-                    bucket = dt.strftime('%Y-%m-%d')
-                else:
-                    bucket = dt.strftime('%Y-%m-%d %H:%M:%S')
-                buckets[bucket] += 1
-            except Exception:
-                continue
+    width, _ = BUCKET_PREFIXES.get(interval, (19, ''))
+    errors = _errors_view(logs)
+    buckets = Counter(
+        _bucket_prefix(asctime, dt, width) for asctime, dt in zip(errors.asctime, errors.dt) if dt
+    )
+    return _label_buckets(buckets, interval)
+
+
+def _bucket_prefix(asctime: str, dt: datetime, width: int) -> str:
+    """
+    Key of a record's time bucket: the first `width` characters of its asctime. Standard
+    'YYYY-MM-DD HH:MM:SS' timestamps are sliced as-is, with no datetime formatting per
+    record; other ISO shapes the parser accepted are normalized through dt first.
+    """
+    if len(asctime) >= 19 and asctime[10] == ' ':
+        return asctime[:width]
+    return dt.strftime(ASCTIME_FORMAT)[:width]
+
+
+def _label_buckets(buckets: Dict[str, int], interval: str) -> Dict[str, int]:
+    """Order the bucket prefixes (fixed width, so string order is time order) and complete their labels."""
+    _, suffix = BUCKET_PREFIXES.get(interval, (19, ''))
+    return {prefix + suffix: count for prefix, count in _ordered_buckets(buckets).items()}
+
+
+def _ordered_buckets(buckets: Dict[Any, int]) -> Dict[Any, int]:
+    """
+    Return buckets as a plain dict in key order. Append-only logs produce bucket keys in
+    order already, so the O(k log k) sort only runs if an O(k) check finds them out of order.
+    """
+    keys = list(buckets)
+    if all(map(le, keys, keys[1:])):
+        return dict(buckets)
     return dict(sorted(buckets.items()))
 
 
 def top_features_by_error(logs, top_n=5):
-    feature_counter = Counter()
-    for log in logs:
-        if log.get('levelname', '').upper() == 'ERROR':
-            feature = log.get('feature', 'N/A')
-            feature_counter[feature] += 1
-    return feature_counter.most_common(top_n)
+    return feature_error_counts(logs).most_common(top_n)
 
 
 def most_frequent_error_messages(logs, top_n=5):
-    msg_counter = Counter()
-    for log in logs:
-        if log.get('levelname', '').upper() == 'ERROR':
-            msg = log.get('message', 'N/A')
-            msg_counter[msg] += 1
-    return msg_counter.most_common(top_n)
+    return Counter(_errors_view(logs).message).most_common(top_n)
+
+
+def _batch_spans(columns: LogColumns) -> Dict[Any, Tuple[Optional[datetime], Optional[datetime]]]:
+    """
+    (start, end) timestamps per correlation ID, in order of first appearance: group each
+    batch's timestamps first, then reduce every group with min()/max().
+    """
+    dts_by_cid = {cid: [] for cid in columns.correlation_id if cid}
+    for cid, dt in zip(columns.correlation_id, columns.dt):
+        if cid and dt:
+            dts_by_cid[cid].append(dt)
+    return {cid: (min(dts), max(dts)) if dts else (None, None) for cid, dts in dts_by_cid.items()}
 
 
 def batch_run_success_failure(logs):
-    # Group by correlation_id, count successes and failures
-    batch_stats = defaultdict(lambda: {'success': 0, 'failure': 0, 'start': None, 'end': None})
-    for log in logs:
-        cid = log.get('correlation_id')
-        if not cid:
-            continue
-        lvl = log.get('levelname', '').upper()
-        asctime = log.get('asctime', '')
-        if lvl == 'ERROR':
-            batch_stats[cid]['failure'] += 1
-        elif lvl == 'INFO':
-            batch_stats[cid]['success'] += 1
-        # Track start/end times
-        try:
-            dt = datetime.strptime(asctime.split(',')[0], "%Y-%m-%d %H:%M:%S")
-            if not batch_stats[cid]['start'] or dt < batch_stats[cid]['start']:
-                batch_stats[cid]['start'] = dt
-            if not batch_stats[cid]['end'] or dt > batch_stats[cid]['end']:
-                batch_stats[cid]['end'] = dt
-        except Exception:
-            pass
-    # Prepare table
-    table = []
-    for correlation_id, batch_stat in batch_stats.items():
-        duration = (batch_stat['end'] - batch_stat['start']).total_seconds() if batch_stat['start'] and batch_stat['end'] else None
-        table.append([correlation_id, batch_stat['success'], batch_stat['failure'], duration])
-    return table
+    # Group by correlation_id, count successes (INFO) and failures (ERROR)
+    if not isinstance(logs, list):
+        logs = list(logs)  # read twice below: full columns and the errors view
+    columns = logs_to_columns(logs)
+    successes = Counter(compress(columns.correlation_id, [lvl == 'INFO' for lvl in columns.levelname]))
+    failures = Counter(_errors_view(logs).correlation_id)
+    return [
+        [correlation_id, successes[correlation_id], failures[correlation_id], _duration_seconds(start, end)]
+        for correlation_id, (start, end) in _batch_spans(columns).items()
+    ]
 
 
 def batch_run_time_analytics(logs):
     # For each correlation_id, compute duration
-    times = defaultdict(lambda: {'start': None, 'end': None})
-    for log in logs:
-        cid = log.get('correlation_id')
-        if not cid:
-            continue
-        asctime = log.get('asctime', '')
-        try:
-            dt = datetime.strptime(asctime.split(',')[0], "%Y-%m-%d %H:%M:%S")
-            if not times[cid]['start'] or dt < times[cid]['start']:
-                times[cid]['start'] = dt
-            if not times[cid]['end'] or dt > times[cid]['end']:
-                times[cid]['end'] = dt
-        except Exception:
-            pass
-    durations = [(correlation_id, (time_info['end'] - time_info['start']).total_seconds() if time_info['start'] and time_info['end'] else None) for correlation_id, time_info in times.items()]
-    if durations:
-        avg = sum(duration for _, duration in durations if duration is not None) / max(1, len([duration for _, duration in durations if duration is not None]))
-        min_d = min((duration for _, duration in durations if duration is not None), default=None)
-        max_d = max((duration for _, duration in durations if duration is not None), default=None)
-    else:
-        avg = min_d = max_d = None
+    durations = [(correlation_id, _duration_seconds(start, end)) for correlation_id, (start, end) in _batch_spans(logs_to_columns(logs)).items()]
+    avg, min_d, max_d = _duration_summary(durations)
     return durations, avg, min_d, max_d
 
 
+@dataclass
+class LogAggregates:
+    """
+    Every counter the analytics menu needs, gathered in a single pass over the logs.
+    See compute_all_analytics().
+    """
+    hour_error_buckets: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    day_error_buckets: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    feature_errors: Counter = field(default_factory=Counter)
+    message_errors: Counter = field(default_factory=Counter)
+    user_totals: Counter = field(default_factory=Counter)
+    user_errors: Counter = field(default_factory=Counter)
+    # Per-batch stats as flat maps keyed by correlation ID; batch_starts holds every ID, in order of first appearance
+    batch_successes: Counter = field(default_factory=Counter)
+    batch_failures: Counter = field(default_factory=Counter)
+    batch_starts: Dict[str, Optional[datetime]] = field(default_factory=dict)
+    batch_ends: Dict[str, Optional[datetime]] = field(default_factory=dict)
+
+    def error_rate(self, interval: str = 'hour') -> Dict[str, int]:
+        """Error counts per time bucket, sorted by bucket (same shape as error_rate_over_time)."""
+        if interval == 'day':
+            return _label_buckets(self.day_error_buckets, 'day')
+        return _label_buckets(self.hour_error_buckets, 'hour')
+
+    def batch_table(self) -> List[List[Any]]:
+        """Rows of [correlation_id, successes, failures, duration_seconds] per batch run."""
+        ends = self.batch_ends
+        return [
+            [cid, self.batch_successes[cid], self.batch_failures[cid], _duration_seconds(start, ends[cid])]
+            for cid, start in self.batch_starts.items()
+        ]
+
+    def batch_durations(self) -> List[Tuple[str, Optional[float]]]:
+        """(correlation_id, duration_seconds) per batch run."""
+        ends = self.batch_ends
+        return [(cid, _duration_seconds(start, ends[cid])) for cid, start in self.batch_starts.items()]
+
+    def user_activity(self, top_n: int = 5) -> List[Tuple[str, int, int, str]]:
+        """(user, total_actions, error_count, error_rate) for the most active users."""
+        return _user_activity_table(self.user_totals, self.user_errors, top_n)
+
+
+def _duration_seconds(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
+    return (end - start).total_seconds() if start and end else None
+
+
+def _user_activity_table(user_counter: Counter, error_counter: Counter, top_n: int) -> List[Tuple[str, int, int, str]]:
+    table = []
+    for user, total in user_counter.most_common(top_n):
+        errors = error_counter[user]
+        error_rate = errors / total if total else 0
+        table.append((user, total, errors, f"{error_rate:.2%}"))
+    return table
+
+
+def compute_all_analytics(logs) -> LogAggregates:
+    """
+    Walk the logs once and build every analytics aggregate at the same time, instead of
+    re-scanning (and re-parsing timestamps) once per report.
+
+    Args:
+        logs: Iterable of log entry dictionaries or LogRec records.
+    Returns:
+        LogAggregates with time buckets, per-feature/message/user counters and batch stats.
+    """
+    if isinstance(logs, list):
+        return _aggregate_log_list(logs)
+    aggregates = LogAggregates()
+    hour_buckets = aggregates.hour_error_buckets
+    day_buckets = aggregates.day_error_buckets
+    feature_errors = aggregates.feature_errors
+    message_errors = aggregates.message_errors
+    user_totals = aggregates.user_totals
+    user_errors = aggregates.user_errors
+    batch_successes = aggregates.batch_successes
+    batch_failures = aggregates.batch_failures
+    batch_starts = aggregates.batch_starts
+    batch_ends = aggregates.batch_ends
+    for lvl, feature, user, cid, dt, message, asctime in iter_records(logs):
+        user_totals[user] += 1
+        is_error = lvl == 'ERROR'
+        if is_error:
+            feature_errors[feature] += 1
+            message_errors[message] += 1
+            user_errors[user] += 1
+            if dt:
+                hour = _bucket_prefix(asctime, dt, 13)
+                hour_buckets[hour] += 1
+                day_buckets[hour[:10]] += 1
+        if cid:
+            if is_error:
+                batch_failures[cid] += 1
+            elif lvl == 'INFO':
+                batch_successes[cid] += 1
+            if cid not in batch_starts:
+                batch_starts[cid] = batch_ends[cid] = dt
+            elif dt:
+                start = batch_starts[cid]
+                if not start or dt < start:
+                    batch_starts[cid] = dt
+                end = batch_ends[cid]
+                if not end or dt > end:
+                    batch_ends[cid] = dt
+    return aggregates
+
+
+def _aggregate_log_list(logs: List[Dict[str, Any]]) -> LogAggregates:
+    """
+    compute_all_analytics() for a list, which can be read more than once: the counters are
+    filled by Counter.update over the cached column views, so the counting runs in C
+    instead of a Python-level += per row.
+    """
+    columns = logs_to_columns(logs)
+    errors = _errors_view(logs)
+    aggregates = LogAggregates()
+    aggregates.user_totals.update(columns.user)
+    aggregates.user_errors.update(errors.user)
+    aggregates.feature_errors.update(errors.feature)
+    aggregates.message_errors.update(errors.message)
+    hours = Counter(_bucket_prefix(asctime, dt, 13) for asctime, dt in zip(errors.asctime, errors.dt) if dt)
+    aggregates.hour_error_buckets.update(hours)
+    day_buckets = aggregates.day_error_buckets
+    for hour, count in hours.items():
+        day_buckets[hour[:10]] += count
+    is_info = map(eq, columns.levelname, repeat('INFO'))
+    aggregates.batch_successes.update(filter(None, compress(columns.correlation_id, is_info)))
+    aggregates.batch_failures.update(filter(None, errors.correlation_id))
+    for cid, (start, end) in _batch_spans(columns).items():
+        aggregates.batch_starts[cid] = start
+        aggregates.batch_ends[cid] = end
+    return aggregates
+
+
+_analytics_cache: Dict[int, Tuple[Any, int, LogAggregates]] = {}
+
+
+def cached_analytics(logs) -> LogAggregates:
+    """
+    Return compute_all_analytics(logs), computed once per logs list and reused by every
+    analytics report run against that same list. Aggregates that were already computed
+    (e.g. streamed via compute_all_analytics(iter_log_records(path))) are returned as-is.
+    """
+    if isinstance(logs, LogAggregates):
+        return logs
+    return _cached_by_identity(_analytics_cache, logs, compute_all_analytics)
+
+
+def _duration_summary(durations: List[Tuple[str, Optional[float]]]):
+    """(average, min, max) of the non-empty durations, or Nones when there are none."""
+    if not durations:
+        return None, None, None
+    values = [duration for _, duration in durations if duration is not None]
+    avg = sum(values) / max(1, len(values))
+    return avg, min(values, default=None), max(values, default=None)
+
+
+def _format_duration_summary(summary_vals) -> Optional[str]:
+    """One-line summary of _duration_summary() output, or None when there is nothing to show."""
+    if not summary_vals:
+        return None
+    avg, min_duration, max_duration = summary_vals
+    if avg is None:
+        return "No durations available."
+    return f"Average: {avg:.2f} s, Min: {min_duration:.2f} s, Max: {max_duration:.2f} s"
+
+
 def export_markdown(headers: List[str], rows: List[Any], analytics_type: str, export_path: str, summary: Optional[str] = None) -> None:
     """
     Export analytics as a Markdown file, creating directories as needed.
@@ -211,34 +771,38 @@ def export_markdown(headers: List[str], rows: List[Any], analytics_type: str, ex
     }
     markdown = build_report_sections(sections)
     try:
-        dir_path = os.path.dirname(export_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
-        with open(export_path, 'w') as file:
-            file.write(markdown)
+        _write_export(export_path, markdown.encode())
         print(f"Analytics report exported as Markdown to {export_path}")
     except Exception as error:
         print(f"Failed to write analytics report to {export_path}: {error}")
 
 
+def _dump_json(obj: Any) -> bytes:
+    """Serialize obj as indented JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # Fall back to stdlib for types orjson can't serialize
+    return json.dumps(obj, indent=2).encode()
+
+
+def _write_export(export_path: str, data: bytes) -> None:
+    """Write an export file in one call, creating its directory as needed."""
+    dir_path = os.path.dirname(export_path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path)
+    with open(export_path, 'wb') as file:
+        file.write(data)
+
+
 def anomaly_detection(logs, interval='hour', threshold=2.0):
     """
     Detect time periods or features with error rates significantly above average (z-score > threshold).
     Returns a list of (bucket, error_count, z_score).
     """
     # Time-based anomaly detection
-    error_counts = error_rate_over_time(logs, interval=interval)
-    values = list(error_counts.values())
-    if len(values) < 2:
-        return []
-    avg = mean(values)
-    std = stdev(values)
-    anomalies = []
-    for bucket, count in error_counts.items():
-        z = (count - avg) / std if std > 0 else 0
-        if z > threshold:
-            anomalies.append((bucket, count, round(z, 2)))
-    return anomalies
+    return zscore_anomaly(error_rate_over_time(logs, interval=interval), threshold)
 
 
 def user_activity_analytics(logs, top_n=5):
@@ -246,19 +810,11 @@ def user_activity_analytics(logs, top_n=5):
     Show most active users, actions per user, and error rates per user.
     Returns a list of (user, total_actions, error_count, error_rate).
     """
-    user_counter = Counter()
-    error_counter = Counter()
-    for log in logs:
-        user = log.get('user', 'N/A')
-        user_counter[user] += 1
-        if log.get('levelname', '').upper() == 'ERROR':
-            error_counter[user] += 1
-    table = []
-    for user, total in user_counter.most_common(top_n):
-        errors = error_counter[user]
-        error_rate = errors / total if total else 0
-        table.append((user, total, errors, f"{error_rate:.2%}"))
-    return table
+    if not isinstance(logs, list):
+        logs = list(logs)  # read twice below: full columns and the errors view
+    user_counter = Counter(logs_to_columns(logs).user)
+    error_counter = Counter(_errors_view(logs).user)
+    return _user_activity_table(user_counter, error_counter, top_n)
 
 
 def feature_anomaly_detection(logs, threshold=2.0):
@@ -266,67 +822,52 @@ def feature_anomaly_detection(logs, threshold=2.0):
     Detect features/modules with error rates significantly above average (z-score > threshold).
     Returns a list of (feature, error_count, z_score).
     """
-    # Count errors per feature
-    feature_counts = Counter()
-    for log in logs:
-        if log.get('levelname', '').upper() == 'ERROR':
-            feature = log.get('feature', 'N/A')
-            feature_counts[feature] += 1
-    values = list(feature_counts.values())
-    if len(values) < 2:
-        return []
-    avg = mean(values)
-    std = stdev(values)
-    anomalies = []
-    for feature, count in feature_counts.items():
-        z = (count - avg) / std if std > 0 else 0
-        if z > threshold:
-            anomalies.append((feature, count, round(z, 2)))
-    return anomalies
+    return zscore_anomaly(feature_error_counts(logs), threshold)
 
 
 # =========================
 # Analytics Registry and Helpers
 # =========================
+# Registry entries read from the single-pass aggregates (see cached_analytics) rather than re-scanning the logs.
 ANALYTICS_REGISTRY = {
     "Error rate over time": {
-        "func": lambda logs, interval: list(error_rate_over_time(logs, interval=interval).items()),
+        "func": lambda logs, interval: list(cached_analytics(logs).error_rate(interval).items()),
         "headers": ["Time", "Error Count"],
         "prompts": [{"name": "Interval (hour/day)", "value": "select", "choices": INTERVAL_CHOICES, "default": "hour"}],
     },
     "Top features by error count": {
-        "func": lambda logs, top_n: top_features_by_error(logs, top_n=top_n),
+        "func": lambda logs, top_n: cached_analytics(logs).feature_errors.most_common(top_n),
         "headers": ["Feature", "Error Count"],
         "prompts": [{"name": "Show top N features (integer)", "value": "int", "choices": None, "default": 5}],
     },
     "Most frequent error messages": {
-        "func": lambda logs, top_n: most_frequent_error_messages(logs, top_n=top_n),
+        "func": lambda logs, top_n: cached_analytics(logs).message_errors.most_common(top_n),
         "headers": ["Error Message", "Count"],
         "prompts": [{"name": "Show top N error messages (integer)", "value": "int", "choices": None, "default": 5}],
     },
     "Batch run success/failure": {
-        "func": lambda logs: batch_run_success_failure(logs),
+        "func": lambda logs: cached_analytics(logs).batch_table(),
         "headers": ["Correlation ID", "Successes", "Failures", "Duration (s)"],
         "prompts": [],
     },
     "Batch run time-to-completion": {
-        "func": lambda logs: batch_run_time_analytics(logs)[0],
+        "func": lambda logs: cached_analytics(logs).batch_durations(),
         "headers": ["Correlation ID", "Duration (s)"],
         "prompts": [],
-        "summary": lambda logs: batch_run_time_analytics(logs)[1:],
+        "summary": lambda logs: _duration_summary(cached_analytics(logs).batch_durations()),
     },
     "Anomaly detection (error spikes)": {
-        "func": lambda logs, interval, threshold: zscore_anomaly(error_rate_over_time(logs, interval=interval), threshold),
+        "func": lambda logs, interval, threshold: zscore_anomaly(cached_analytics(logs).error_rate(interval), threshold),
         "headers": ["Time", "Error Count", "Z-score"],
         "prompts": [{"name": "Interval (hour/day)", "value": "select", "choices": INTERVAL_CHOICES, "default": "hour"}, {"name": "Z-score threshold (float)", "value": "float", "choices": None, "default": 2.0}],
     },
     "Feature-based anomaly detection": {
-        "func": lambda logs, threshold: zscore_anomaly(feature_error_counts(logs), threshold),
+        "func": lambda logs, threshold: zscore_anomaly(cached_analytics(logs).feature_errors, threshold),
         "headers": ["Feature", "Error Count", "Z-score"],
         "prompts": [{"name": "Z-score threshold (float)", "value": "float", "choices": None, "default": 2.0}],
     },
     "User activity analytics": {
-        "func": lambda logs, top_n: user_activity_analytics(logs, top_n=top_n),
+        "func": lambda logs, top_n: cached_analytics(logs).user_activity(top_n),
         "headers": ["User", "Total Actions", "Error Count", "Error Rate"],
         "prompts": [{"name": "Show top N users (integer)", "value": "int", "choices": None, "default": 5}],
     },
@@ -377,35 +918,72 @@ def zscore_anomaly(counts: Dict[str, int], threshold: float) -> List[Tuple[str,
     count_values = list(counts.values())
     if len(count_values) < 2:
         return []
-    avg = mean(count_values)
-    std = stdev(count_values)
+    avg, std = _mean_stdev(count_values)
+    if std == 0:
+        return []
+    # z > threshold  <=>  count > avg + threshold * std, so screen on a precomputed cutoff
+    # and only compute z-scores for the (few) anomalies
+    cutoff = avg + threshold * std
     return [
         (key, count, round((count - avg) / std, 2))
         for key, count in counts.items()
-        if std > 0 and (count - avg) / std > threshold
+        if count > cutoff
     ]
 
 
+def _mean_stdev(values: List[float]) -> Tuple[float, float]:
+    """
+    Mean and sample standard deviation of two or more values, using math.fsum reductions
+    (accurately rounded, C speed) instead of the pure-Python statistics.mean/stdev.
+    """
+    avg = fsum(values) / len(values)
+    deviations = [value - avg for value in values]
+    return avg, sqrt(fsum(map(mul, deviations, deviations)) / (len(values) - 1))
+
+
 def feature_error_counts(logs: List[Dict[str, Any]]) -> Counter:
     """
     Count errors per feature/module in the logs.
 
     Args:
-        logs: List of log entry dictionaries.
+        logs: List of log entry dictionaries, or a log file path (only its ERROR lines are parsed).
     Returns:
         Counter mapping feature name to error count.
     """
-    feature_counts = Counter()
-    for log_entry in logs:
-        if safe_get(log_entry, ['levelname'], '').upper() == 'ERROR':
-            feature = safe_get(log_entry, ['feature'], 'N/A')
-            feature_counts[feature] += 1
-    return feature_counts
+    return Counter(_errors_view(logs).feature)
+
+
+# Tables longer than this skip tabulate's per-cell width/alignment pass
+PLAIN_TABLE_MIN_ROWS = 100
+
+
+def _render_github_md(rows: List[Any], headers: List[str]) -> str:
+    """
+    Unaligned GitHub-flavored Markdown table; renders the same as tabulate's, far faster for
+    long tables. Cells are formatted as tabulate does by default: None as an empty cell, and
+    every number in a column that holds floats with the 'g' format (3600.0 -> 3600).
+    """
+    columns = [_md_column(column) for column in zip(*rows)]
+    lines = ["| " + " | ".join(headers) + " |", "|" + "|".join(["---"] * len(headers)) + "|"]
+    lines.extend("| " + " | ".join(row) + " |" for row in zip(*columns))
+    return "\n".join(lines)
+
+
+def _md_column(column: Tuple[Any, ...]) -> List[str]:
+    """Cell texts of one table column, matching tabulate's missingval and floatfmt defaults."""
+    if any(isinstance(value, float) for value in column):
+        return [
+            '' if value is None
+            else format(value, 'g') if isinstance(value, (int, float)) and not isinstance(value, bool)
+            else str(value)
+            for value in column
+        ]
+    return ['' if value is None else str(value) for value in column]
 
 
 def render_table(data: List[Any], headers: List[str]) -> str:
     """
-    Render a table using tabulate, or a message if data is empty.
+    Render a table using tabulate (or _render_github_md for long tables), or a message if data is empty.
 
     Args:
         data: List of rows (each row is a list or tuple).
@@ -415,12 +993,20 @@ def render_table(data: List[Any], headers: List[str]) -> str:
     """
     if not data:
         return "No data available."
+    if len(data) > PLAIN_TABLE_MIN_ROWS:
+        return _render_github_md(data, headers)
+    from tabulate import tabulate
     return tabulate(data, headers=headers, tablefmt="github")
 
 
 # =========================
 # Analytics Menu (Interactive)
 # =========================
+_menu_results_cache: Dict[int, Tuple[Any, int, Dict[Tuple[str, Tuple[Any, ...]], Tuple[Any, Optional[str]]]]] = {}
+# Every per-logs cache filled through _cached_by_identity, for clear_log_caches()
+_LOG_VIEW_CACHES = (_records_cache, _columns_cache, _errors_cache, _time_index_cache, _analytics_cache, _menu_results_cache)
+
+
 def analytics_menu(logs: List[Dict[str, Any]]) -> None:
     """
     Interactive analytics/reporting menu. Handles prompts, runs analytics, and supports export.
@@ -433,6 +1019,9 @@ def analytics_menu(logs: List[Dict[str, Any]]) -> None:
     analytics_type_last = None
     analytics_headers_last = None
     analytics_summary_last = None
+    # (analytics name, params) -> (result, summary) for this logs list. Kept across menu
+    # visits, so repeating a report never recomputes; loading another log file starts afresh.
+    results_cache = _cached_by_identity(_menu_results_cache, logs, lambda _: {})
     while True:
         analytics_choices = list(ANALYTICS_REGISTRY.keys()) + [
             "Export last analytics report (JSON)",
@@ -450,19 +1039,22 @@ def analytics_menu(logs: List[Dict[str, Any]]) -> None:
                 label, typ, choices, default = prompt['name'], prompt['value'], prompt.get('choices'), prompt.get('default')
                 value = safe_prompt(label, typ, choices, default)
                 params.append(value)
-            result = entry["func"](logs, *params)
+            cache_key = (analytics_action, tuple(params))
+            if cache_key not in results_cache:
+                result = entry["func"](logs, *params)
+                summary = None
+                if "summary" in entry:
+                    summary = _format_duration_summary(entry["summary"](logs))
+                results_cache[cache_key] = (result, summary)
+            result, summary = results_cache[cache_key]
+            if not result:
+                # Nothing to render or export; keep the last non-empty report as the export target
+                print(f"\n{analytics_action}: No data available.")
+                continue
             analytics_last = result
+            analytics_summary_last = summary
             analytics_type_last = analytics_action
             analytics_headers_last = entry["headers"]
-            analytics_summary_last = None
-            if "summary" in entry:
-                summary_vals = entry["summary"](logs)
-                if summary_vals:
-                    avg, min_duration, max_duration = summary_vals
-                    analytics_summary_last = (
-                        f"Average: {avg:.2f} s, Min: {min_duration:.2f} s, Max: {max_duration:.2f} s"
-                        if avg is not None else "No durations available."
-                    )
             print(f"\n{analytics_action}:")
             print(render_table(result, entry["headers"]))
             if analytics_summary_last:
@@ -473,16 +1065,12 @@ def analytics_menu(logs: List[Dict[str, Any]]) -> None:
             else:
                 export_path = prompt_text("Export analytics report to file:", default="analytics_report.json")
                 try:
-                    dir_path = os.path.dirname(export_path)
-                    if dir_path and not os.path.exists(dir_path):
-                        os.makedirs(dir_path)
-                    with open(export_path, 'w') as file:
-                        json.dump({
-                            "type": analytics_type_last,
-                            "data": analytics_last,
-                            "headers": analytics_headers_last,
-                            "summary": analytics_summary_last
-                        }, file, indent=2)
+                    _write_export(export_path, _dump_json({
+                        "type": analytics_type_last,
+                        "data": analytics_last,
+                        "headers": analytics_headers_last,
+                        "summary": analytics_summary_last
+                    }))
                     print(f"Analytics report exported to {export_path}")
                 except Exception as error:
                     print(f"Failed to write analytics report to {export_path}: {error}")
@@ -512,76 +1100,85 @@ def log_parser(jira=None, options=None, user_email=None, batch_index=None, uniqu
     if not logs:
         print("No logs found.")
         return
-    while True:
-        action = prompt_select(
-            "Select log filter/search option:",
-            choices=[
-                "Filter by log level",
-                "Filter by feature/module",
-                "Filter by correlation ID",
-                "Filter by time frame",
-                "Show summary",
-                "Export filtered logs",
-                "Exit log parser"
-            ]
-        )
-        filtered_logs = logs
-        if action == "Filter by log level":
-            log_level = prompt_select("Select log level:", choices=LOG_LEVEL_CHOICES)
-            filtered_logs = filter_logs(logs, level=log_level)
-        elif action == "Filter by feature/module":
-            feature_names = sorted(set(safe_get(log, ['feature'], 'N/A') for log in logs))
-            selected_feature = prompt_select("Select feature:", choices=[{"name": feature, "value": feature} for feature in feature_names])
-            filtered_logs = filter_logs(logs, feature=selected_feature["value"])
-        elif action == "Filter by correlation ID":
-            correlation_ids = sorted(set(safe_get(log, ['correlation_id'], 'N/A') for log in logs if safe_get(log, ['correlation_id'])))
-            if not correlation_ids:
-                print("No correlation IDs found in logs.")
+    try:
+        # Choice lists for the feature/correlation ID filters, built on first use and reused
+        feature_names = None
+        correlation_ids = None
+        while True:
+            action = prompt_select(
+                "Select log filter/search option:",
+                choices=[
+                    "Filter by log level",
+                    "Filter by feature/module",
+                    "Filter by correlation ID",
+                    "Filter by time frame",
+                    "Show summary",
+                    "Analytics & reports",
+                    "Export filtered logs",
+                    "Exit log parser"
+                ]
+            )
+            filtered_logs = logs
+            if action == "Filter by log level":
+                log_level = prompt_select("Select log level:", choices=LOG_LEVEL_CHOICES)
+                filtered_logs = filter_logs(logs, level=log_level)
+            elif action == "Filter by feature/module":
+                if feature_names is None:
+                    feature_names = sorted(set(logs_to_columns(logs).feature))
+                selected_feature = prompt_select("Select feature:", choices=[{"name": feature, "value": feature} for feature in feature_names])
+                filtered_logs = filter_logs(logs, feature=selected_feature["value"])
+            elif action == "Filter by correlation ID":
+                if correlation_ids is None:
+                    correlation_ids = sorted(set(filter(None, logs_to_columns(logs).correlation_id)))
+                if not correlation_ids:
+                    print("No correlation IDs found in logs.")
+                    continue
+                selected_correlation_id = prompt_select("Select correlation ID:", choices=[{"name": cid, "value": cid} for cid in correlation_ids])
+                filtered_logs = filter_logs(logs, correlation_id=selected_correlation_id["value"])
+            elif action == "Filter by time frame":
+                start_time = prompt_text("Start time (YYYY-MM-DD HH:MM:SS):", default="")
+                end_time = prompt_text("End time (YYYY-MM-DD HH:MM:SS):", default="")
+                filtered_logs = filter_logs(logs, start_time=start_time or None, end_time=end_time or None)
+            elif action == "Show summary":
+                print(f"Total log entries: {len(logs)}")
+                # Count over the cached LogRec columns rather than looking fields up in every entry dict
+                columns = logs_to_columns(logs)
+                level_counts = Counter(columns.levelname)
+                feature_counts = Counter(columns.feature)
+                print("Log entries by level:")
+                for level, count in level_counts.items():
+                    print(f"  {level}: {count}")
+                print("Log entries by feature:")
+                for feature, count in feature_counts.items():
+                    print(f"  {feature}: {count}")
                 continue
-            selected_correlation_id = prompt_select("Select correlation ID:", choices=[{"name": cid, "value": cid} for cid in correlation_ids])
-            filtered_logs = filter_logs(logs, correlation_id=selected_correlation_id["value"])
-        elif action == "Filter by time frame":
-            start_time = prompt_text("Start time (YYYY-MM-DD HH:MM:SS):", default="")
-            end_time = prompt_text("End time (YYYY-MM-DD HH:MM:SS):", default="")
-            filtered_logs = filter_logs(logs, start_time=start_time or None, end_time=end_time or None)
-        elif action == "Show summary":
-            print(f"Total log entries: {len(logs)}")
-            level_counts = {}
-            feature_counts = {}
-            for log_entry in logs:
-                level = safe_get(log_entry, ['levelname'], 'N/A')
-                feature = safe_get(log_entry, ['feature'], 'N/A')
-                level_counts[level] = level_counts.get(level, 0) + 1
-                feature_counts[feature] = feature_counts.get(feature, 0) + 1
-            print("Log entries by level:")
-            for level, count in level_counts.items():
-                print(f"  {level}: {count}")
-            print("Log entries by feature:")
-            for feature, count in feature_counts.items():
-                print(f"  {feature}: {count}")
-            continue
-        elif action == "Export filtered logs":
-            export_path = prompt_text("Export filtered logs to file:", default="filtered_logs.json")
-            try:
-                dir_path = os.path.dirname(export_path)
-                if dir_path and not os.path.exists(dir_path):
-                    os.makedirs(dir_path)
-                with open(export_path, 'w') as file:
-                    json.dump(filtered_logs, file, indent=2)
-                print(f"Filtered logs exported to {export_path}")
-            except Exception as error:
-                print(f"Failed to write filtered logs to {export_path}: {error}")
-            continue
-        elif action == "Exit log parser":
-            print("Exiting log parser.")
-            break
-        # Show filtered logs (if not summary/export/exit)
-        if action.startswith("Filter"):
-            print(f"\nFiltered log entries: {len(filtered_logs)}\n")
-            for log_entry in filtered_logs[:50]:  # Show up to 50 entries
-                print(json.dumps(log_entry, indent=2))
-            if len(filtered_logs) > 50:
-                print(f"... {len(filtered_logs)-50} more entries not shown ...")
+            elif action == "Analytics & reports":
+                # Aggregates are cached per logs list, so re-entering the menu does not rescan
+                analytics_menu(logs)
+                continue
+            elif action == "Export filtered logs":
+                export_path = prompt_text("Export filtered logs to file:", default="filtered_logs.json")
+                try:
+                    _write_export(export_path, _dump_json([public_entry(log_entry) for log_entry in filtered_logs]))
+                    print(f"Filtered logs exported to {export_path}")
+                except Exception as error:
+                    print(f"Failed to write filtered logs to {export_path}: {error}")
+                continue
+            elif action == "Exit log parser":
+                print("Exiting log parser.")
+                break
+            # Show filtered logs (if not summary/export/exit)
+            if action.startswith("Filter"):
+                print(f"\nFiltered log entries: {len(filtered_logs)}\n")
+                for log_entry in filtered_logs[:50]:  # Show up to 50 entries
+                    print(_dump_json(public_entry(log_entry)).decode())
+                if len(filtered_logs) > 50:
+                    print(f"... {len(filtered_logs)-50} more entries not shown ...")
+    finally:
+        # The cached views of logs (records, columns, indexes, aggregates, menu results)
+        # belong to this session; drop them rather than keeping the parse alive afterwards
+        clear_log_caches()
+
 
 # =========================
 # CLI Entrypoint for Standalone Use
@@ -594,21 +1191,35 @@ def main() -> None:
         --log-file: Path to the log file.
         --correlation-id: Filter logs by correlation ID.
         --level: Filter logs by log level.
+        --analytics: Print the analytics reports with their default parameters.
     """
     parser = argparse.ArgumentParser(description="Jirassic Pack Log Monitoring Utility")
     parser.add_argument('--log-file', type=str, default=LOG_FILE, help='Path to the log file')
     parser.add_argument('--correlation-id', type=str, help='Filter logs by correlation ID')
     parser.add_argument('--level', type=str, help='Filter logs by level (INFO, ERROR, etc.)')
+    parser.add_argument('--analytics', action='store_true', help='Print analytics reports for the whole log file')
     args = parser.parse_args()
 
-    logs = parse_logs(args.log_file)
-    if args.correlation_id:
-        logs = [log for log in logs if safe_get(log, ['correlation_id']) == args.correlation_id]
-    if args.level:
-        logs = [log for log in logs if safe_get(log, ['levelname'], '').upper() == args.level.upper()]
+    if not os.path.exists(args.log_file):
+        print(f"Log file not found: {args.log_file}")
+        return
+    if args.analytics:
+        # Aggregate while streaming; the reports only need the counters, never the entries
+        aggregates = compute_all_analytics(iter_log_records(args.log_file))
+        for name, entry in ANALYTICS_REGISTRY.items():
+            params = [prompt["default"] for prompt in entry["prompts"]]
+            print(f"\n{name}:")
+            print(render_table(entry["func"](aggregates, *params), entry["headers"]))
+            if "summary" in entry:
+                summary = _format_duration_summary(entry["summary"](aggregates))
+                if summary:
+                    print(summary)
+        return
+    # Filter while streaming, skipping lines that cannot match before they are decoded
+    logs = parse_logs_filtered(args.log_file, level=args.level, correlation_id=args.correlation_id)
 
     for log_entry in logs:
-        print(json.dumps(log_entry, indent=2))
+        print(_dump_json(public_entry(log_entry)).decode())
 
     # TODO: Add monitoring/alerting logic (e.g., error rate, anomaly detection, etc.)
 
@@ -70,6 +70,8 @@ def prompt_summarize_tickets_options(options: dict, jira: Any = None) -> dict:
         output_dir = get_option(options, 'output_dir', default=os.environ.get('JIRA_OUTPUT_DIR', 'output'))
         unique_suffix = options.get('unique_suffix', '')
         ac_field = options.get('acceptance_criteria_field') or os.environ.get('JIRA_ACCEPTANCE_CRITERIA_FIELD', 'customfield_10001')
+        # Opt-in: send large LLM grouping retry passes through the OpenAI Batch API
+        llm_batch_options = {key: options[key] for key in ('llm_batch_retries', 'llm_batch_threshold', 'llm_batch_timeout') if key in options}
         schema = SummarizeTicketsOptionsSchema()
         try:
             # Always pass ISO strings to Marshmallow
@@ -101,7 +103,8 @@ def prompt_summarize_tickets_options(options: dict, jira: Any = None) -> dict:
         'end_date': end_date,
         'output_dir': output_dir,
         'unique_suffix': unique_suffix,
-        'acceptance_criteria_field': ac_field
+        'acceptance_criteria_field': ac_field,
+        **llm_batch_options
     }
 
 prompt_summarize_tickets_options = log_entry_exit(prompt_summarize_tickets_options)
@@ -1,24 +1,19 @@
 import os
+import json
+import time
 import openai
 from dotenv import load_dotenv
 import yaml
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
-def call_openai_llm(prompt, model="gpt-3.5-turbo", max_tokens=512, temperature=0.2, response_format=None):
+BATCH_TERMINAL_STATUSES = ("completed", "failed", "expired", "cancelled")
+
+def get_openai_api_key():
     """
-    Call the OpenAI ChatCompletion API with the given prompt and return the response text.
-    Tries to load the API key from the environment, .env file, or jirassicpack/config.yaml.
-    Args:
-        prompt (str): The prompt to send to the LLM.
-        model (str): The OpenAI model to use (default: gpt-3.5-turbo).
-        max_tokens (int): Maximum tokens in the response.
-        temperature (float): Sampling temperature.
-        response_format (str): The format of the response.
-    Returns:
-        str: The LLM's response text.
+    Return the OpenAI API key from the environment, a .env file, or jirassicpack/config.yaml (in that order).
     Raises:
-        Exception: If the API key is not found or the API call fails.
+        RuntimeError: If no API key is configured.
     """
     # Load .env if present
     load_dotenv()
@@ -33,7 +28,24 @@ def call_openai_llm(prompt, model="gpt-3.5-turbo", max_tokens=512, temperature=0
             pass
     if not api_key:
         raise RuntimeError("OPENAI_API_KEY not set in environment, .env, or jirassicpack/config.yaml.")
-    client = openai.OpenAI(api_key=api_key)
+    return api_key
+
+def call_openai_llm(prompt, model="gpt-3.5-turbo", max_tokens=512, temperature=0.2, response_format=None):
+    """
+    Call the OpenAI ChatCompletion API with the given prompt and return the response text.
+    Tries to load the API key from the environment, .env file, or jirassicpack/config.yaml.
+    Args:
+        prompt (str): The prompt to send to the LLM.
+        model (str): The OpenAI model to use (default: gpt-3.5-turbo).
+        max_tokens (int): Maximum tokens in the response.
+        temperature (float): Sampling temperature.
+        response_format (str): The format of the response.
+    Returns:
+        str: The LLM's response text.
+    Raises:
+        Exception: If the API key is not found or the API call fails.
+    """
+    client = openai.OpenAI(api_key=get_openai_api_key())
     response = client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
@@ -52,18 +64,7 @@ def call_openai_llm_threaded(prompt, model="gpt-3.5-turbo", max_tokens=512, temp
 
 async def call_openai_llm_async(prompt, model="gpt-3.5-turbo", max_tokens=512, temperature=0.2, response_format=None):
     """Async version of call_openai_llm using openai.AsyncOpenAI."""
-    load_dotenv()
-    api_key = os.environ.get("OPENAI_API_KEY")
-    if not api_key:
-        try:
-            with open("jirassicpack/config.yaml") as f:
-                config = yaml.safe_load(f)
-                api_key = config.get("openai", {}).get("api_key")
-        except Exception:
-            pass
-    if not api_key:
-        raise RuntimeError("OPENAI_API_KEY not set in environment, .env, or jirassicpack/config.yaml.")
-    client = openai.AsyncOpenAI(api_key=api_key)
+    client = openai.AsyncOpenAI(api_key=get_openai_api_key())
     response = await client.chat.completions.create(
         model=model,
         messages=[{"role": "user", "content": prompt}],
@@ -71,4 +72,60 @@ async def call_openai_llm_async(prompt, model="gpt-3.5-turbo", max_tokens=512, t
         temperature=temperature,
         response_format=response_format,
     )
-    return response.choices[0].message.content 
\ No newline at end of file
+    return response.choices[0].message.content
+
+def call_openai_llm_batch(prompts, model="gpt-3.5-turbo", max_tokens=512, temperature=0.2, response_format=None, poll_interval=30, timeout=None, on_poll=None):
+    """
+    Submit many prompts through the OpenAI Batch API and wait for the results.
+    Batch requests are billed at a discount and are not subject to the synchronous rate limit,
+    so this suits large, latency-tolerant workloads such as retrying failed chunks.
+    Args:
+        prompts (dict): Mapping of custom_id -> prompt text.
+        model (str): The OpenAI model to use (default: gpt-3.5-turbo).
+        max_tokens (int): Maximum tokens in each response.
+        temperature (float): Sampling temperature.
+        response_format (dict): The format of the responses.
+        poll_interval (int): Seconds to wait between batch status checks.
+        timeout (float, optional): Give up (and cancel the batch) after this many seconds.
+        on_poll (callable, optional): Called as on_poll(batch, elapsed_seconds) after every status check.
+    Returns:
+        dict: Mapping of custom_id -> response text, or None for requests that did not complete.
+    Raises:
+        Exception: If the API key is not found or the batch cannot be submitted.
+    """
+    client = openai.OpenAI(api_key=get_openai_api_key())
+    lines = []
+    for custom_id, prompt in prompts.items():
+        body = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        if response_format:
+            body["response_format"] = response_format
+        lines.append(json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body}))
+    batch_file = client.files.create(file=("jirassicpack_batch.jsonl", "\n".join(lines).encode("utf-8")), purpose="batch")
+    batch = client.batches.create(input_file_id=batch_file.id, endpoint="/v1/chat/completions", completion_window="24h")
+    started = time.monotonic()
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        if timeout is not None and time.monotonic() - started > timeout:
+            client.batches.cancel(batch.id)
+            break
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+        if on_poll:
+            on_poll(batch, time.monotonic() - started)
+    results = {custom_id: None for custom_id in prompts}
+    if batch.status == "completed" and batch.output_file_id:
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            try:
+                content = record["response"]["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                content = None
+            results[record.get("custom_id")] = content
+    return results
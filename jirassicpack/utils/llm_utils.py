@@ -4,7 +4,7 @@ llm_utils.py
 Shared utilities for LLM-based ticket grouping and prompt construction.
 """
 import json
-from concurrent.futures import as_completed
+from concurrent.futures import wait
 
 def build_llm_manager_prompt(params, example_categories, prompt_examples):
     """Build the LLM prompt for manager-focused ticket categorization."""
@@ -44,15 +44,38 @@ def call_llm_for_chunks(chunk_prompts, use_async, llm_utils, response_format, ex
         loop = asyncio.get_event_loop()
         chunk_results = loop.run_until_complete(process_all_chunks_async(chunk_prompts))
     else:
-        chunk_futures = [executor.submit(llm_utils.call_openai_llm, llm_prompt, response_format=response_format) for chunk_keys, llm_prompt in chunk_prompts]
-        for (chunk_keys, _), future in zip(chunk_prompts, as_completed(chunk_futures)):
+        chunk_futures = [executor.submit(llm_utils.call_openai_llm, llm_prompt, response_format=response_format) for _, llm_prompt in chunk_prompts]
+        wait(chunk_futures)
+        # Iterate in submission order so each response stays paired with its own chunk keys
+        for (chunk_keys, _), future in zip(chunk_prompts, chunk_futures):
             try:
-                llm_response = future.result()
-                chunk_results.append((chunk_keys, llm_response))
-            except Exception as e:
+                chunk_results.append((chunk_keys, future.result()))
+            except Exception:
                 chunk_results.append((chunk_keys, None))
     return chunk_results
 
+def call_llm_batch_for_chunks(chunk_prompts, llm_utils, response_format, logger, timeout):
+    """
+    Submit all chunk prompts as a single OpenAI Batch API job and return (chunk_keys, response) pairs.
+    Waits at most timeout seconds, reporting the job status on every poll; chunks without a response
+    (including when the job fails) come back as None.
+    """
+    prompts = {f"chunk-{index}": llm_prompt for index, (_, llm_prompt) in enumerate(chunk_prompts)}
+
+    def report_poll(batch, elapsed):
+        counts = getattr(batch, "request_counts", None)
+        progress = f", {counts.completed}/{counts.total} requests done" if counts else ""
+        message = f"[summarize_tickets] Waiting for OpenAI batch {batch.id}: {batch.status}{progress} ({int(elapsed)}s of {int(timeout)}s)"
+        print(message)
+        logger('info', message)
+
+    try:
+        responses = llm_utils.call_openai_llm_batch(prompts, response_format=response_format, timeout=timeout, on_poll=report_poll)
+    except Exception as e:
+        logger('error', f"[summarize_tickets] OpenAI Batch API request failed: {e}")
+        responses = {}
+    return [(chunk_keys, responses.get(f"chunk-{index}")) for index, (chunk_keys, _) in enumerate(chunk_prompts)]
+
 def parse_llm_chunk_results(chunk_results, chunk_prompts, superbatch, logger):
     """Parse LLM responses for each chunk, log/print diagnostics, and collect results."""
     results = {}
@@ -76,18 +99,32 @@ def parse_llm_chunk_results(chunk_results, chunk_prompts, superbatch, logger):
     return results, failed_chunks
 
 def llm_group_tickets(ticket_contexts, params, use_async, chunk_sizes, manager_prompt, executor, logger):
-    """Main LLM grouping logic: chunk tickets, call LLM, parse results, retry failed chunks with smaller sizes."""
+    """
+    Main LLM grouping logic: chunk tickets, call LLM, parse results, retry failed chunks with smaller sizes.
+    The first pass always runs online. With the llm_batch_retries option (off by default), retry passes
+    with more than llm_batch_threshold chunks (default 100) are sent through the OpenAI Batch API instead,
+    waiting at most llm_batch_timeout seconds (default 600) before the unfinished chunks fall through to
+    the next retry.
+    """
     import jirassicpack.utils.llm as llm_utils
+    params = params or {}
+    use_batch_for_retries = params.get('llm_batch_retries', False)
+    batch_threshold = params.get('llm_batch_threshold', 100)
+    batch_timeout = params.get('llm_batch_timeout', 600)
     response_format = {"type": "json_object"}
     superbatch = ticket_contexts
     results = {}
-    for chunk_size in chunk_sizes:
+    for pass_index, chunk_size in enumerate(chunk_sizes):
         chunk_prompts = []
         for chunk in chunk_tickets(superbatch, chunk_size):
             chunk_keys = [t['key'] for t in chunk]
             llm_prompt = manager_prompt + f"Tickets: {json.dumps(chunk)}"
             chunk_prompts.append((chunk_keys, llm_prompt))
-        chunk_results = call_llm_for_chunks(chunk_prompts, use_async, llm_utils, response_format, executor)
+        if use_batch_for_retries and pass_index > 0 and len(chunk_prompts) > batch_threshold:
+            logger('info', f"[summarize_tickets] Submitting {len(chunk_prompts)} retry chunks via the OpenAI Batch API.")
+            chunk_results = call_llm_batch_for_chunks(chunk_prompts, llm_utils, response_format, logger, batch_timeout)
+        else:
+            chunk_results = call_llm_for_chunks(chunk_prompts, use_async, llm_utils, response_format, executor)
         for (chunk_keys, llm_response) in chunk_results:
             print(f"[summarize_tickets][DIAG] Processed chunk keys: {chunk_keys}")
             print(f"[summarize_tickets][DIAG] Chunk result: {llm_response}")
@@ -1,9 +1,12 @@
 import logging
+import re
 import uuid
 from typing import Any, Dict, Optional
 
 # Add your own log formatter or use the existing one from cli.py if needed
 
+_SENSITIVE_KEY_RE = re.compile(r'token|password|secret|api_key', re.IGNORECASE)
+
 def redact_sensitive(options: Any) -> Any:
     """
     Redact sensitive fields in options dict for logging/output.
@@ -14,11 +17,7 @@ def redact_sensitive(options: Any) -> Any:
     """
     if not isinstance(options, dict):
         return options
-    redacted = options.copy()
-    for k in redacted:
-        if any(s in k.lower() for s in ["token", "password", "secret", "api_key"]):
-            redacted[k] = "***REDACTED***"
-    return redacted
+    return {k: ("***REDACTED***" if isinstance(k, str) and _SENSITIVE_KEY_RE.search(k) else v) for k, v in options.items()}
 
 def contextual_log(level: str, message: str, extra: Optional[Dict[str, Any]] = None, **kwargs) -> None:
     """
@@ -33,6 +33,7 @@ def halt_cli(reason=None):
     sys.exit(0)
 
 def retry_or_skip(action_desc: str, func, *args, **kwargs):
+    from jirassicpack.utils.prompt_utils import prompt_select, RETRY_PROMPT_STYLE
     while True:
         try:
             return func(*args, **kwargs)
@@ -40,7 +41,8 @@ def retry_or_skip(action_desc: str, func, *args, **kwargs):
             print(f"🦖 Error during {action_desc}: {e}")
             choice = prompt_select(
                 f"🦖 {action_desc} failed. What would you like to do?",
-                choices=["Retry", "Skip", "Exit"]
+                choices=["Retry", "Skip", "Exit"],
+                style=RETRY_PROMPT_STYLE
             )
             if choice == "Retry":
                 continue
@@ -48,4 +50,3 @@ def retry_or_skip(action_desc: str, func, *args, **kwargs):
                 return None
             else:
                 sys.exit(1)
-from jirassicpack.utils.prompt_utils import prompt_select 
\ No newline at end of file
@@ -3,19 +3,38 @@ Output and reporting utilities for Jirassic Pack CLI.
 Handles pretty-printing, report writing, markdown rendering, and output directory management.
 """
 import os
+import sys
 import json
 from datetime import datetime
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from jirassicpack.utils.rich_prompt import rich_panel, rich_info, rich_error, rich_success
 from jirassicpack.constants import WRITTEN_TO, FAILED_TO
 from jirassicpack.utils.logging import contextual_log
 
-def pretty_print_result(result):
+PRETTY_PRINT_MAX_CHARS = 20000
+
+def pretty_print_result(result, max_chars=PRETTY_PRINT_MAX_CHARS):
     """
     Pretty-prints a result object as formatted JSON in a rich panel.
+    Output longer than max_chars is truncated so large results don't flood the terminal.
     Args:
         result (Any): The object to print.
+        max_chars (int): Maximum number of characters to display.
     """
-    rich_panel(json.dumps(result, indent=2), style="info")
+    text = None
+    if orjson is not None:
+        try:
+            text = orjson.dumps(result, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            text = None  # Fall back to stdlib for types orjson can't serialize
+    if text is None:
+        text = json.dumps(result, indent=2, default=str)
+    if max_chars and len(text) > max_chars:
+        text = text[:max_chars] + f"\n… ({len(text) - max_chars} more chars truncated)"
+    rich_panel(text, style="info")
 
 def write_report(filename: str, content, context=None, filetype='md', feature=None, item_name='Report'):
     """
@@ -55,13 +74,19 @@ def render_markdown_report_template(template: str, context: dict) -> str:
     """
     return template.format(**context)
 
+# Directories already created (or confirmed) during this run
+_ensured_dirs = set()
+
 def ensure_output_dir(output_dir):
     """
-    Ensure the output directory exists.
+    Ensure the output directory exists. Repeat calls for the same directory skip the filesystem entirely.
     Args:
         output_dir (str): Path to the output directory.
     """
+    if output_dir in _ensured_dirs:
+        return
     os.makedirs(output_dir, exist_ok=True)
+    _ensured_dirs.add(output_dir)
 
 def make_output_filename(feature, params, output_dir='output', ext='md'):
     """
@@ -92,6 +117,13 @@ def make_output_filename(feature, params, output_dir='output', ext='md'):
     filename = '_'.join(parts) + f'.{ext}'
     return f"{output_dir}/{filename}"
 
+_STATUS_EMOJI = {
+    'done': '✅', 'closed': '✅', 'resolved': '✅',
+    'in progress': '🟡', 'in review': '🟡', 'doing': '🟡',
+    'blocked': '⛔', 'on hold': '⛔', 'overdue': '⛔',
+}
+_DEFAULT_STATUS_EMOJI = '⬜️'
+
 def status_emoji(status: str) -> str:
     """
     Map a Jira status string to a corresponding emoji for visual reporting.
@@ -100,14 +132,7 @@ def status_emoji(status: str) -> str:
     Returns:
         str: Emoji representing the status.
     """
-    s = status.lower() if status else ''
-    if s in ['done', 'closed', 'resolved']:
-        return '✅'
-    elif s in ['in progress', 'in review', 'doing']:
-        return '🟡'
-    elif s in ['blocked', 'on hold', 'overdue']:
-        return ''
-    return '⬜️'
+    return _STATUS_EMOJI.get(status.lower() if status else '', _DEFAULT_STATUS_EMOJI)
 
 def print_section_header(header: str):
     rich_panel(header, style="info")
@@ -120,5 +145,18 @@ def print_batch_summary(results):
         color = "success" if status == "Success" else "error"
         rich_info(f"{name:<15} | [{{color}}]{status}[/{{color}}]")
 
+_JUNGLE_GREEN_B = b'\033[38;5;34m'
+_RESET_B = b'\033[0m'
+_CELEBRATE_MESSAGE = "🎉 Success! 🎉"
+_CELEBRATE_BYTES = _JUNGLE_GREEN_B + _CELEBRATE_MESSAGE.encode('utf-8') + _RESET_B + b'\n'
+
 def celebrate_success() -> None:
-    print("\033[38;5;34m🎉 Success! 🎉\033[0m") 
\ No newline at end of file
+    # Write the pre-encoded banner straight to the byte stream when stdout is UTF-8
+    buffer = getattr(sys.stdout, 'buffer', None)
+    encoding = (getattr(sys.stdout, 'encoding', None) or '').lower().replace('-', '')
+    if buffer is None or encoding != 'utf8':
+        print(f"\033[38;5;34m{_CELEBRATE_MESSAGE}\033[0m")
+        return
+    sys.stdout.flush()  # Keep ordering with anything already written through the text layer
+    buffer.write(_CELEBRATE_BYTES)
+    buffer.flush() 
\ No newline at end of file
@@ -3,16 +3,34 @@ Progress bar and spinner utilities for Jirassic Pack CLI.
 Handles progress display and spinners for long-running operations.
 """
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+from rich.errors import LiveError
+from rich.markup import escape
 from contextlib import contextmanager
-import time
+from jirassicpack.utils.rich_prompt import console
 
 @contextmanager
 def spinner(message: str):
-    print(f"⏳ {message}")
+    """
+    Show an animated status spinner while the wrapped block runs.
+    Rich redraws the spinner from a background thread and clears it on exit. The message is
+    shown literally (it often holds Jira data, so it is never parsed as Rich markup). If another
+    live display already owns the console (e.g. inside progress_bar, or a nested spinner), the
+    message is printed once above it instead.
+    Args:
+        message (str): Status text shown next to the spinner.
+    """
+    text = f"⏳ {escape(message)}"
+    status = console.status(text)
+    try:
+        status.start()
+    except LiveError:
+        console.print(text)
+        yield
+        return
     try:
         yield
     finally:
-        print("✔️ Done.")
+        status.stop()
 
 def progress_bar(iterable, desc="Progress"):
     total = len(iterable) if hasattr(iterable, '__len__') else None
@@ -22,8 +40,9 @@ def progress_bar(iterable, desc="Progress"):
         BarColumn(),
         TimeElapsedColumn(),
         transient=True,
+        console=console,
     ) as progress:
-        task = progress.add_task(desc, total=total)
+        task = progress.add_task(escape(desc), total=total)
         for index, element in enumerate(iterable, 1):
             progress.update(task, completed=index)
             yield element 
\ No newline at end of file
@@ -4,10 +4,9 @@ Handles all user input prompts, selection, pagination, and fuzzy search.
 """
 import questionary
 from questionary import Choice, Style as QStyle
-from InquirerPy import inquirer
-from InquirerPy.utils import get_style
 from jirassicpack.utils.rich_prompt import rich_panel
 from typing import Any, List, Optional
+from bisect import bisect_left
 
 # Jurassic Park color palette
 JUNGLE_GREEN = '\033[38;5;34m'
@@ -23,13 +22,91 @@ DEFAULT_PROMPT_STYLE = QStyle([
     ("answer", "fg:#ffaa00 bold"),
     ("highlighted", "fg:#ffcc00 bold"),
 ])
-INQUIRERPY_STYLE = get_style({
+RETRY_PROMPT_STYLE = QStyle([
+    ("selected", "fg:#ffcc00 bold"),
+    ("pointer", "fg:#22bb22 bold"),
+])
+INQUIRERPY_STYLE_SPEC = {
     "selected": "fg:#22bb22 bold",
     "pointer": "fg:#ffcc00 bold",
     "question": "fg:#00aaee bold",
     "answer": "fg:#ffaa00 bold",
     "highlighted": "fg:#ffcc00 bold",
-})
+}
+
+# InquirerPy is only needed for fuzzy prompts on long lists, so it is imported on first use
+_inquirer = None
+_inquirerpy_style = None
+
+def _get_inquirer():
+    """Import InquirerPy on first use and return its inquirer module."""
+    global _inquirer, _inquirerpy_style
+    if _inquirer is None:
+        from InquirerPy import inquirer
+        from InquirerPy.utils import get_style
+        _inquirerpy_style = get_style(INQUIRERPY_STYLE_SPEC)
+        _inquirer = inquirer
+    return _inquirer
+
+def _get_inquirerpy_style():
+    """Return the InquirerPy style built from INQUIRERPY_STYLE_SPEC."""
+    _get_inquirer()
+    return _inquirerpy_style
+
+def _build_prefix_index(labels):
+    """
+    Sort choice labels once for "Jump to letter" (_paginate builds it on the first jump).
+    Returns (sorted_keys, original_indices): casefolded labels in sorted order plus the list
+    position each one came from, so every prefix maps to one contiguous, bisectable slice.
+    """
+    folded = [label.casefold() for label in labels]
+    order = sorted(range(len(folded)), key=folded.__getitem__)
+    return [folded[index] for index in order], order
+
+def _find_prefix_index(prefix_index, prefix):
+    """
+    Return the index of the first label (in list order) starting with prefix, case-insensitive,
+    or None. prefix_index is the result of _build_prefix_index for the labels.
+    """
+    if not prefix:
+        return None
+    sorted_keys, original_indices = prefix_index
+    needle = prefix.casefold()
+    lo = bisect_left(sorted_keys, needle)
+    if lo == len(sorted_keys) or not sorted_keys[lo].startswith(needle):
+        return None
+    # Every key in [lo, hi) shares the prefix; hi is where the prefix's successor would sort
+    hi = bisect_left(sorted_keys, needle[:-1] + chr(ord(needle[-1]) + 1), lo)
+    return min(original_indices[lo:hi])
+
+def _choice_label(choice):
+    """Return the text label of a plain string or questionary Choice ('' if it has none)."""
+    if isinstance(choice, str):
+        return choice
+    title = getattr(choice, 'title', None)
+    return title if isinstance(title, str) else ''
+
+# id(choices) -> (choices, len(choices), Choice tuple); holding the list keeps its id from being reused
+_CHOICE_CACHE = {}
+_CHOICE_CACHE_SIZE = 32
+
+def _is_named_choices(choices):
+    """Return True if choices is a non-empty list of {'name', 'value'} dicts."""
+    return bool(choices) and isinstance(choices[0], dict) and 'name' in choices[0] and 'value' in choices[0]
+
+def _to_choices(choices):
+    """
+    Convert a list of {'name', 'value'} dicts into a tuple of questionary Choice objects.
+    Results are memoized per list object, so redrawing a prompt with the same list reuses its Choices.
+    """
+    cached = _CHOICE_CACHE.get(id(choices))
+    if cached is not None and cached[0] is choices and cached[1] == len(choices):
+        return cached[2]
+    q_choices = tuple(Choice(title=c['name'], value=c['value']) for c in choices)
+    if len(_CHOICE_CACHE) >= _CHOICE_CACHE_SIZE:
+        _CHOICE_CACHE.clear()
+    _CHOICE_CACHE[id(choices)] = (choices, len(choices), q_choices)
+    return q_choices
 
 def prompt_text(message, default=None, **kwargs):
     rich_panel(message, style="prompt")
@@ -37,8 +114,8 @@ def prompt_text(message, default=None, **kwargs):
 
 def prompt_select(message, choices, **kwargs):
     style = kwargs.pop('style', DEFAULT_PROMPT_STYLE)
-    if choices and isinstance(choices[0], dict) and 'name' in choices[0] and 'value' in choices[0]:
-        q_choices = [Choice(title=c['name'], value=c['value']) for c in choices]
+    if _is_named_choices(choices):
+        q_choices = list(_to_choices(choices))
         rich_panel(message, style="prompt")
         picked = questionary.select(message, choices=q_choices, style=style, **kwargs).ask()
         if isinstance(picked, Choice):
@@ -68,8 +145,8 @@ def prompt_password(message, **kwargs):
 
 def prompt_checkbox(message, choices, **kwargs):
     style = kwargs.pop('style', DEFAULT_PROMPT_STYLE)
-    if choices and isinstance(choices[0], dict) and 'name' in choices[0] and 'value' in choices[0]:
-        q_choices = [Choice(title=c['name'], value=c['value']) for c in choices]
+    if _is_named_choices(choices):
+        q_choices = list(_to_choices(choices))
         rich_panel(message, style="prompt")
         picked = questionary.checkbox(message, choices=q_choices, style=style, **kwargs).ask()
         if picked and isinstance(picked[0], Choice):
@@ -82,49 +159,88 @@ def prompt_checkbox(message, choices, **kwargs):
             picked = [p.value for p in picked]
         return picked
 
+PREVIOUS_PAGE_LABEL = "⬅️ Previous page"
+NEXT_PAGE_LABEL = "➡️ Next page"
+JUMP_TO_LETTER_LABEL = "🔤 Jump to letter"
+JUMP_TO_PAGE_LABEL = "🔢 Jump to page"
+
+def _paginate(choices, message, page_size, exit_label=None, style=DEFAULT_PROMPT_STYLE):
+    """
+    Show choices one page at a time with previous/next, jump-to-letter and jump-to-page navigation.
+    Shared by select_with_pagination_and_fuzzy and _select_from_list.
+    Args:
+        choices (list): Strings or questionary Choice objects to page through.
+        message (str): Prompt message; the page number is appended.
+        page_size (int): Number of choices per page.
+        exit_label (str, optional): Navigation entry that cancels the prompt.
+        style: questionary style for the page prompt.
+    Returns:
+        The selected choice (Choice objects are unwrapped to their value), or None if cancelled.
+    """
+    total_pages = (len(choices) - 1) // page_size + 1
+    page_cache = {}
+    prefix_index = None  # built on the first "Jump to letter" and reused for the rest of this prompt
+
+    def jump_to_page(page):
+        try:
+            requested = int(prompt_text("Enter page number:", default=str(page + 1))) - 1
+        except (TypeError, ValueError):
+            return page
+        return min(max(requested, 0), total_pages - 1)
+
+    def jump_to_letter(page):
+        nonlocal prefix_index
+        letter = prompt_text("Type a letter to jump:")
+        if prefix_index is None:
+            prefix_index = _build_prefix_index([_choice_label(choice) for choice in choices])
+        idx = _find_prefix_index(prefix_index, letter)
+        if idx is None:
+            print("No items found for that letter.")
+            return page
+        return idx // page_size
+
+    nav_handlers = {
+        PREVIOUS_PAGE_LABEL: lambda page: page - 1,
+        NEXT_PAGE_LABEL: lambda page: page + 1,
+        JUMP_TO_LETTER_LABEL: jump_to_letter,
+        JUMP_TO_PAGE_LABEL: jump_to_page,
+    }
+    page = 0
+    while True:
+        page_with_nav = page_cache.get(page)
+        if page_with_nav is None:
+            start = page * page_size
+            end = start + page_size
+            nav = []
+            if page > 0:
+                nav.append(PREVIOUS_PAGE_LABEL)
+            if end < len(choices):
+                nav.append(NEXT_PAGE_LABEL)
+            nav.append(JUMP_TO_LETTER_LABEL)
+            nav.append(JUMP_TO_PAGE_LABEL)
+            if exit_label is not None:
+                nav.append(exit_label)
+            page_with_nav = page_cache[page] = choices[start:end] + nav
+        selection = questionary.select(f"{message} (Page {page+1}/{total_pages})", choices=page_with_nav, style=style).ask()
+        if isinstance(selection, Choice):
+            selection = selection.value
+        handler = nav_handlers.get(selection)
+        if handler is not None:
+            page = handler(page)
+            continue
+        if selection is None or (exit_label is not None and selection == exit_label):
+            return None
+        return selection
+
 def select_with_pagination_and_fuzzy(choices, message="Select an item:", page_size=15, fuzzy_threshold=30):
     if len(choices) > fuzzy_threshold:
-        return inquirer.fuzzy(
+        return _get_inquirer().fuzzy(
             message=message,
             choices=choices,
             max_height="70%"
         ).execute()
     elif len(choices) > page_size:
-        page = 0
-        total_pages = (len(choices) - 1) // page_size + 1
-        while True:
-            start = page * page_size
-            end = start + page_size
-            page_choices = choices[start:end]
-            nav = []
-            if page > 0:
-                nav.append("⬅️ Previous page")
-            if end < len(choices):
-                nav.append("➡️ Next page")
-            nav.append("🔤 Jump to letter")
-            nav.append("🔢 Jump to page")
-            nav.append("❌ Exit")
-            selection = prompt_select(
-                f"{message} (Page {page+1}/{total_pages})",
-                choices=page_choices + nav
-            )
-            if selection == "⬅️ Previous page":
-                page -= 1
-            elif selection == "➡️ Next page":
-                page += 1
-            elif selection == "🔢 Jump to page":
-                page = int(prompt_text("Enter page number:", default=str(page+1))) - 1
-            elif selection == "🔤 Jump to letter":
-                letter = prompt_text("Type a letter to jump:")
-                idx = next((index for index, choice in enumerate(choices) if choice.lower().startswith(letter.lower())), None)
-                if idx is not None:
-                    page = idx // page_size
-                else:
-                    print("No items found for that letter.")
-            elif selection == "❌ Exit":
-                return None
-            else:
-                return selection
+        return _paginate(choices, message, page_size, exit_label="❌ Exit")
     else:
         return prompt_select(message, choices=choices)
 
@@ -139,10 +255,14 @@ def _select_from_list(
     style=DEFAULT_PROMPT_STYLE
 ):
     display_fn = display_fn or (lambda x: str(x))
-    if items and isinstance(items[0], dict) and 'name' in items[0] and 'value' in items[0]:
-        choices = [Choice(title=item['name'], value=item['value']) for item in items]
+    named_items = _is_named_choices(items)
+    choice_to_item = None
+    if named_items:
+        choices = list(_to_choices(items))
     else:
         choices = [display_fn(item) for item in items]
+        # Built in reverse so duplicate labels map to their first item, as list.index did
+        choice_to_item = dict(zip(reversed(choices), reversed(items)))
     if allow_abort:
         abort_label = "❌ Abort"
         choices = choices + [abort_label]
@@ -152,9 +272,9 @@ def _select_from_list(
             picked = [p.value for p in picked]
         if allow_abort and abort_label in picked:
             return None
-        if items and isinstance(items[0], dict) and 'name' in items[0] and 'value' in items[0]:
+        if named_items:
             return picked
-        return [items[choices.index(p)] for p in picked if p != abort_label]
+        return [choice_to_item[p] for p in picked]
     if len(choices) > fuzzy_threshold:
         display_map = {}
         display_choices = []
@@ -167,57 +287,26 @@ def _select_from_list(
                 display_choices.append(choice)
         if allow_abort and abort_label not in display_choices:
             display_choices.append(abort_label)
-        picked = inquirer.fuzzy(message=message, choices=display_choices, max_height="70%", style=INQUIRERPY_STYLE).execute()
+        picked = _get_inquirer().fuzzy(message=message, choices=display_choices, max_height="70%", style=_get_inquirerpy_style()).execute()
         if allow_abort and picked == abort_label:
             return None
         return display_map.get(picked, picked)
     elif len(choices) > page_size:
-        page = 0
-        total_pages = (len(choices) - 1) // page_size + 1
-        while True:
-            start = page * page_size
-            end = start + page_size
-            page_choices = choices[start:end]
-            nav = []
-            if page > 0:
-                nav.append("⬅️ Previous page")
-            if end < len(choices):
-                nav.append("➡️ Next page")
-            nav.append("🔤 Jump to letter")
-            nav.append("🔢 Jump to page")
-            if allow_abort:
-                nav.append(abort_label)
-            selection = questionary.select(f"{message} (Page {page+1}/{total_pages})", choices=page_choices + nav, style=style).ask()
-            if isinstance(selection, Choice):
-                selection = selection.value
-            if selection == "⬅️ Previous page":
-                page -= 1
-            elif selection == "➡️ Next page":
-                page += 1
-            elif selection == "🔢 Jump to page":
-                page = int(prompt_text("Enter page number:", default=str(page+1))) - 1
-            elif selection == "🔤 Jump to letter":
-                letter = prompt_text("Type a letter to jump:")
-                idx = next((index for index, choice in enumerate(choices) if isinstance(choice, str) and choice.lower().startswith(letter.lower())), None)
-                if idx is not None:
-                    page = idx // page_size
-                else:
-                    print("No items found for that letter.")
-            elif allow_abort and selection == abort_label:
-                return None
-            else:
-                if items and isinstance(items[0], dict) and 'name' in items[0] and 'value' in items[0]:
-                    return selection
-                return items[choices.index(selection)]
+        # The abort label lives in the navigation row, so leave it out of the paged items
+        page_items = choices[:-1] if allow_abort else choices
+        selection = _paginate(page_items, message, page_size, exit_label=abort_label if allow_abort else None, style=style)
+        if selection is None or named_items:
+            return selection
+        return choice_to_item[selection]
     else:
         picked = questionary.select(message, choices=choices, style=style).ask()
         if isinstance(picked, Choice):
             picked = picked.value
         if allow_abort and picked == abort_label:
             return None
-        if items and isinstance(items[0], dict) and 'name' in items[0] and 'value' in items[0]:
+        if named_items:
             return picked
-        return items[choices.index(picked)]
+        return choice_to_item[picked]
 
 # Public alias for select_from_list
 select_from_list = _select_from_list
@@ -230,14 +319,19 @@ def select_with_fuzzy_multiselect(choices, message="Select items:", min_selectio
     abort_label = "❌ Abort"
     done_label = "✅ Done selecting"
     clear_label = "🔄 Clear Selections"
-    base_choices = choices.copy()
-    selected = []
+    # The caller's list is only read, never mutated, so no defensive copy is needed.
+    base_choices = choices
+    # Extract each choice's value once so the redraw loop is a single set lookup per choice
+    values = [c['value'] if isinstance(c, dict) else c for c in base_choices]
+    # Insertion-ordered dict used as an ordered set of picked values
+    selected = {}
+    selected_display = ""
     while True:
         # Build list of choices not yet selected
-        remaining = [c for c in base_choices if (c['value'] if isinstance(c, dict) else c) not in selected]
+        remaining = [c for value, c in zip(values, base_choices) if value not in selected]
         fuzzy_choices = remaining + [{"name": done_label, "value": done_label}, {"name": abort_label, "value": abort_label}]
-        prompt_message = message + "\n(Use spacebar or Enter to select, type to fuzzy search, select 'Done' when finished.)\nSelected: " + ", ".join(str(s) for s in selected)
-        picked = inquirer.fuzzy(
+        prompt_message = message + "\n(Use spacebar or Enter to select, type to fuzzy search, select 'Done' when finished.)\nSelected: " + selected_display
+        picked = _get_inquirer().fuzzy(
             message=prompt_message,
             choices=fuzzy_choices,
             multiselect=False,
@@ -251,14 +345,15 @@ def select_with_fuzzy_multiselect(choices, message="Select items:", min_selectio
         # Extract value if dict
         val = picked['value'] if isinstance(picked, dict) else picked
         if val not in selected:
-            selected.append(val)
+            selected[val] = None
+            selected_display = f"{selected_display}, {val}" if selected_display else str(val)
     # Final confirmation with checkbox
     if not selected:
         return None
-    confirm_choices = [{"name": str(c), "value": c, "enabled": True} for c in selected] + [{"name": clear_label, "value": clear_label}, {"name": abort_label, "value": abort_label}]
+    confirm_choices = [{"name": str(c), "value": c, "enabled": True} for c in selected.keys()] + [{"name": clear_label, "value": clear_label}, {"name": abort_label, "value": abort_label}]
     while True:
         confirm_message = "Review your selections (spacebar to select/deselect, Enter to confirm):"
-        confirmed = inquirer.checkbox(
+        confirmed = _get_inquirer().checkbox(
             message=confirm_message,
             choices=confirm_choices,
             instruction="Type to filter",
@@ -271,7 +366,8 @@ def select_with_fuzzy_multiselect(choices, message="Select items:", min_selectio
         if not confirmed or abort_label in confirmed:
             return None
         if clear_label in confirmed:
-            selected = []
+            selected = {}
+            selected_display = ""
             break  # Go back to fuzzy selection
         if min_selection and len(confirmed) < min_selection:
             print(f"Please select at least {min_selection} item(s), or Abort.")
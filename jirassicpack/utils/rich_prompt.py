@@ -1,3 +1,4 @@
+from functools import lru_cache
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
@@ -64,9 +65,14 @@ def rich_prompt_confirm(message: str, default: bool = False) -> bool:
     prompt_msg = f"{JURASSIC_ICON} [prompt]{message}[/prompt]"
     return Confirm.ask(prompt_msg, default=default)
 
+@lru_cache(maxsize=128)
+def _panel(message: str, title: str = None, style: str = "banner") -> Panel:
+    """Build (and cache) the Panel for a message; prompts redraw the same panels over and over."""
+    return Panel(message, title=title, style=style, box=box.ROUNDED)
+
 def rich_panel(message: str, title: str = None, style: str = "banner") -> None:
     """Print a rich panel with a Jurassic Park–themed style."""
-    console.print(Panel(message, title=title, style=style, box=box.ROUNDED))
+    console.print(_panel(message, title, style))
 
 # Jurassic Park–themed panels and Easter eggs
 
@@ -2,13 +2,32 @@
 Validation and option utilities for Jirassic Pack CLI.
 Handles input validation, required checks, and option retrieval.
 """
+import logging
 from jirassicpack.utils.prompt_utils import prompt_select, prompt_text, prompt_password
 from jirassicpack.utils.rich_prompt import rich_error
 from marshmallow import ValidationError
 from jirassicpack.utils.jira import select_jira_user
 
+logger = logging.getLogger(__name__)
+
+def _report_validation_error(err):
+    """Show the first message (and optional suggestion) of a Marshmallow ValidationError."""
+    suggestion = None
+    if hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages and isinstance(err.messages[0], tuple):
+        message, suggestion = err.messages[0]
+    elif hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages:
+        message = err.messages[0]
+    else:
+        message = str(err)
+    rich_error(f"Input validation error: {message}", suggestion)
+
 def get_option(options, key, prompt=None, default=None, choices=None, required=False, validate=None, password=False, marshmallow_field=None, marshmallow_schema=None):
     value = options.get(key, default)
+    # Loading through the schema already runs the field's own deserialization, so only
+    # deserialize the bare field when there is no schema to do it.
+    deserialize = marshmallow_field.deserialize if marshmallow_field and not marshmallow_schema else None
+    schema_load = marshmallow_schema.load if marshmallow_schema else None
+    schema_input = {}
     while True:
         if choices:
             value = prompt_select(prompt or f"Select {key}:", choices=choices)
@@ -18,38 +37,26 @@ def get_option(options, key, prompt=None, default=None, choices=None, required=F
             value = prompt_text(prompt or f"Enter {key}:", default=default or '')
             if value == '' and default is not None:
                 value = default
-        if marshmallow_field:
+        # Cheap checks first so trivially invalid input never reaches Marshmallow
+        if required and (not value or not value.strip()):
+            rich_error(f"{key} is required.")
+            continue
+        if validate and not validate(value):
+            rich_error(f"Invalid value for {key}.")
+            continue
+        if deserialize:
             try:
-                marshmallow_field.deserialize(value)
+                deserialize(value)
             except ValidationError as err:
-                suggestion = None
-                if hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages and isinstance(err.messages[0], tuple):
-                    message, suggestion = err.messages[0]
-                elif hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages:
-                    message = err.messages[0]
-                else:
-                    message = str(err)
-                rich_error(f"Input validation error: {message}", suggestion)
+                _report_validation_error(err)
                 continue
-        if marshmallow_schema:
+        if schema_load:
+            schema_input[key] = value
             try:
-                marshmallow_schema.load({key: value})
+                schema_load(schema_input)
             except ValidationError as err:
-                suggestion = None
-                if hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages and isinstance(err.messages[0], tuple):
-                    message, suggestion = err.messages[0]
-                elif hasattr(err, 'messages') and isinstance(err.messages, list) and err.messages:
-                    message = err.messages[0]
-                else:
-                    message = str(err)
-                rich_error(f"Input validation error: {message}", suggestion)
+                _report_validation_error(err)
                 continue
-        if validate and not validate(value):
-            rich_error(f"Invalid value for {key}.")
-            continue
-        if required and (not value or not value.strip()):
-            rich_error(f"{key} is required.")
-            continue
         break
     return value
 
@@ -64,18 +71,56 @@ def require_param(param, name):
         raise ValueError(f"Missing required parameter: {name}")
     return param
 
+_MISSING = object()
+
 def safe_get(d, keys, default=None):
     """
     Safely get a nested value from a dict using a list of keys.
+    Integer keys also index into lists, e.g. safe_get(issue, ['fields', 'fixVersions', 0, 'name']).
     Example: safe_get(issue, ['fields', 'summary'], '').
     """
     current = d
-    try:
-        for key in keys:
+    for key in keys:
+        if isinstance(current, dict):
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return default
+        elif isinstance(current, (list, tuple)) and isinstance(key, int):
+            if not -len(current) <= key < len(current):
+                return default
             current = current[key]
-        return current
-    except Exception:
-        return default
+        else:
+            return default
+    return current
+
+# (schema class, field names) -> tuple of (name, kind, prompt, default, choices)
+_FIELD_PLAN_CACHE = {}
+
+def _schema_field_plan(schema):
+    """
+    Return the prompt plan for a Marshmallow schema's fields, building it once per schema class.
+    Each entry is (name, kind, prompt, default, choices) with kind one of 'select', 'password', 'text'.
+    """
+    cache_key = (type(schema), tuple(schema.fields))
+    field_plan = _FIELD_PLAN_CACHE.get(cache_key)
+    if field_plan is not None:
+        return field_plan
+    plan = []
+    for name, field in schema.fields.items():
+        prompt = field.metadata.get('prompt') or f"Enter {name.replace('_', ' ').title()}:"
+        default = field.default if hasattr(field, 'default') else None
+        if hasattr(field, 'load_default'):
+            default = field.load_default
+        choices = field.choices if hasattr(field, 'choices') and field.choices else None
+        if choices:
+            kind = 'select'
+        elif getattr(field, 'password', False):
+            kind = 'password'
+        else:
+            kind = 'text'
+        plan.append((name, kind, prompt, default, choices))
+    field_plan = _FIELD_PLAN_CACHE[cache_key] = tuple(plan)
+    return field_plan
 
 def prompt_with_schema(schema, options, jira=None, abort_option=True):
     """
@@ -92,26 +137,26 @@ def prompt_with_schema(schema, options, jira=None, abort_option=True):
     from jirassicpack.utils.rich_prompt import rich_error
     from jirassicpack.utils.jira import select_jira_user
     from marshmallow import ValidationError
-    from jirassicpack.utils.message_utils import info
     data = dict(options)
-    fields = schema.fields
-    print(f"[DEEPDEBUG] prompt_with_schema called. Initial data: {data}")
-    info(f"[DEEPDEBUG] prompt_with_schema called. Initial data: {data}")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logger.debug(f"prompt_with_schema called. Initial data: {data}")
+    field_plan = _schema_field_plan(schema)
+    prompt_handlers = {
+        'select': lambda prompt, default, choices: prompt_select(prompt, choices=choices, default=default),
+        'password': lambda prompt, default, choices: prompt_password(prompt),
+        'text': lambda prompt, default, choices: prompt_text(prompt, default=default),
+    }
     while True:
-        for name, field in fields.items():
+        for name, kind, prompt, default, choices in field_plan:
             # Always prompt for 'user', even if a value is present
             if name == 'user':
-                print(f"[DEEPDEBUG] Forcing prompt for 'user'. Current data: {data}")
-                info(f"[DEEPDEBUG] Forcing prompt for 'user'. Current data: {data}")
+                if debug_enabled:
+                    logger.debug(f"Forcing prompt for 'user'. Current data: {data}")
             elif name in data and data[name] not in (None, ''):
                 continue
-            prompt = field.metadata.get('prompt') or f"Enter {name.replace('_', ' ').title()}:"
-            default = field.default if hasattr(field, 'default') else None
-            if hasattr(field, 'load_default'):
-                default = field.load_default
             if name == 'user' and jira:
-                print(f"[DEEPDEBUG] Invoking select_jira_user for 'user' field.")
-                info("[DEEPDEBUG] Invoking select_jira_user for 'user' field.")
+                logger.debug("Invoking select_jira_user for 'user' field.")
                 label_user_tuple = select_jira_user(jira, allow_multiple=False)
                 if not label_user_tuple or not label_user_tuple[1]:
                     if abort_option:
@@ -120,19 +165,14 @@ def prompt_with_schema(schema, options, jira=None, abort_option=True):
                         continue
                 data[name] = label_user_tuple[1].get('accountId')
                 continue
-            if hasattr(field, 'choices') and field.choices:
-                value = prompt_select(prompt, choices=field.choices, default=default)
-            elif getattr(field, 'password', False):
-                value = prompt_password(prompt)
-            else:
-                value = prompt_text(prompt, default=default)
+            value = prompt_handlers[kind](prompt, default, choices)
             if abort_option and value in (None, '__ABORT__', '❌ Abort'):
                 return '__ABORT__'
             data[name] = value
         try:
             validated = schema.load(data)
-            print(f"[DEEPDEBUG] prompt_with_schema validated: {validated}")
-            info(f"[DEEPDEBUG] prompt_with_schema validated: {validated}")
+            if debug_enabled:
+                logger.debug(f"prompt_with_schema validated: {validated}")
             return validated
         except ValidationError as err:
             for field_name, msgs in err.messages.items():